@@ -1,5 +1,23 @@
 # Include your imports here
+import codecs
 import math
+import mmap
+import string
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the batch helpers fall back to the scalar functions
+    np = None
+
+
+Column = Union[float, Sequence[float]]
+
+ASCII_UPPERCASE_BYTES = string.ascii_uppercase.encode('ascii')
+ASCII_COMPATIBLE_ENCODINGS = {'ascii', 'utf-8', 'iso8859-1', 'cp1252'}
 
 
 def simple_interest(principal: float, rate: float, years: float) -> float:
@@ -35,6 +53,107 @@ def uppercase_count(s: str) -> int:
     return upper_count
 
 
+def _uppercase_count_chunks(chunks: Iterable[bytes], encoding: str) -> int:
+    """
+    Count uppercase letters over a stream of encoded chunks.
+
+    Pure ASCII chunks are counted by deleting A-Z with bytes.translate and
+    comparing lengths. Other chunks are decoded incrementally, so multi-byte
+    characters split across chunks are handled, and counted with str.isupper.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    ascii_fast_path = codecs.lookup(encoding).name in ASCII_COMPATIBLE_ENCODINGS
+    upper_count = 0
+
+    for chunk in chunks:
+        if ascii_fast_path and chunk.isascii() and not decoder.getstate()[0]:
+            upper_count += len(chunk) - len(chunk.translate(None, ASCII_UPPERCASE_BYTES))
+        else:
+            upper_count += sum(map(str.isupper, decoder.decode(chunk)))
+
+    upper_count += sum(map(str.isupper, decoder.decode(b'', final=True)))
+    return upper_count
+
+
+def uppercase_count_buffer(buffer: Union[bytes, bytearray, memoryview, mmap.mmap],
+                           encoding: str = 'utf-8', chunk_size: int = 1 << 20) -> int:
+    """
+    Count the number of uppercase letters in an encoded buffer, one chunk at a time.
+
+    Args:
+        buffer (bytes-like): The encoded text, e.g. bytes or a memory-mapped file.
+        encoding (str): The encoding of the text.
+        chunk_size (int): The number of bytes examined per step.
+
+    Returns:
+        int: The same count uppercase_count would return for the decoded text.
+    """
+    if type(chunk_size) is not int or chunk_size <= 0:
+        raise Exception("Invalid input")
+
+    chunks = (buffer[start:start + chunk_size] for start in range(0, len(buffer), chunk_size))
+    return _uppercase_count_chunks(chunks, encoding)
+
+
+def uppercase_count_file(file_name: str, encoding: str = 'utf-8', chunk_size: int = 1 << 20,
+                         use_mmap: bool = True) -> int:
+    """
+    Count the number of uppercase letters in a text file without loading it whole.
+
+    Args:
+        file_name (str): The path of the text file.
+        encoding (str): The encoding of the file.
+        chunk_size (int): The number of bytes examined per step.
+        use_mmap (bool): Memory-map the file instead of reading it in chunks.
+
+    Returns:
+        int: The number of uppercase letters in the file.
+
+    Raises:
+        Exception: If the file does not exist.
+    """
+    if type(chunk_size) is not int or chunk_size <= 0:
+        raise Exception("Invalid input")
+
+    try:
+        with open(file_name, 'rb') as file_handle:
+            if use_mmap:
+                try:
+                    with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                        return uppercase_count_buffer(buffer, encoding, chunk_size)
+                except ValueError:
+                    # Empty files cannot be memory-mapped, read them normally instead
+                    pass
+
+            chunks = iter(lambda: file_handle.read(chunk_size), b'')
+            return _uppercase_count_chunks(chunks, encoding)
+
+    except FileNotFoundError:
+        raise Exception("File Not Found")
+
+
+def uppercase_count_files(file_names: List[str], encoding: str = 'utf-8',
+                          workers: Optional[int] = None) -> Dict[str, int]:
+    """
+    Count the number of uppercase letters in many text files with a process pool.
+
+    Args:
+        file_names (List[str]): The paths of the text files.
+        encoding (str): The encoding of the files.
+        workers (int, optional): The number of worker processes. Defaults to the CPU count.
+            Use 1 to count in the current process.
+
+    Returns:
+        Dict[str, int]: The uppercase count of every file, keyed by file name.
+    """
+    if workers == 1 or len(file_names) <= 1:
+        return {file_name: uppercase_count_file(file_name, encoding) for file_name in file_names}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(uppercase_count_file, file_names, repeat(encoding))
+        return dict(zip(file_names, counts))
+
+
 def distance_between_points(x1: float, y1: float, x2: float, y2: float) -> float:
     """
     Calculate the Euclidean distance between two points (x1, y1) and (x2, y2).
@@ -47,5 +166,116 @@ def distance_between_points(x1: float, y1: float, x2: float, y2: float) -> float
 
     Returns:
         float: The Euclidean distance between the two points.
+
+    Raises:
+        OverflowError: If the square of a finite coordinate difference overflows.
+    """
+    return math.sqrt(_squared(x2 - x1) + _squared(y2 - y1))
+
+
+def _squared(value: float) -> float:
+    """
+    value * value, which distance_between_points_batch computes the same way.
+    Like value ** 2, a finite value whose square overflows raises OverflowError.
+    """
+    square = value * value
+    if square == math.inf and math.isfinite(value):
+        raise OverflowError(34, 'Numerical result out of range')
+    return square
+
+
+def _column_length(*columns: Column) -> int:
+    """
+    The common length of the sequence columns, or 1 if all columns are scalars.
+    Raises Exception("Invalid input") if the sequence columns differ in length.
+    """
+    length = None
+    for column in columns:
+        if not isinstance(column, (int, float)):
+            if length is None:
+                length = len(column)
+            elif len(column) != length:
+                raise Exception("Invalid input")
+
+    return 1 if length is None else length
+
+
+def _broadcast_columns(*columns: Column) -> list:
+    """
+    Turn a mix of scalars and equal-length sequences into iterables of the same length.
+    Scalars are repeated so they can be zipped with the sequence columns.
+    """
+    length = _column_length(*columns)
+
+    return [repeat(column, length) if isinstance(column, (int, float)) else column
+            for column in columns]
+
+
+def simple_interest_batch(principal: Column, rate: Column, years: Column) -> Sequence[float]:
     """
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    Calculate the simple interest for whole columns of loans in one pass.
+
+    Each argument can be a scalar, a NumPy array or any sequence such as an
+    array.array buffer. Scalars are broadcast against the other columns.
+
+    Args:
+        principal (float or Sequence[float]): The principal amounts.
+        rate (float or Sequence[float]): The annual interest rates in percentage.
+        years (float or Sequence[float]): The times in years.
+
+    Returns:
+        Sequence[float]: A numpy.ndarray when NumPy is installed, otherwise an
+        array.array('d') with the same values simple_interest would return.
+
+    Raises:
+        Exception: If the sequence arguments do not have the same length.
+    """
+    if np is not None:
+        _column_length(principal, rate, years)
+        principal, rate, years = (np.asarray(column, dtype=float) for column in (principal, rate, years))
+        return principal * years * rate / 100
+
+    return array('d', map(simple_interest, *_broadcast_columns(principal, rate, years)))
+
+
+def distance_between_points_batch(x1: Column, y1: Column, x2: Column, y2: Column) -> Sequence[float]:
+    """
+    Calculate the Euclidean distances between whole columns of point pairs in one pass.
+
+    Each argument can be a scalar, a NumPy array or any sequence such as an
+    array.array buffer. Scalars are broadcast against the other columns, so a
+    single point can be measured against many points at once.
+
+    Args:
+        x1 (float or Sequence[float]): The x-coordinates of the first points.
+        y1 (float or Sequence[float]): The y-coordinates of the first points.
+        x2 (float or Sequence[float]): The x-coordinates of the second points.
+        y2 (float or Sequence[float]): The y-coordinates of the second points.
+
+    Returns:
+        Sequence[float]: A numpy.ndarray when NumPy is installed, otherwise an
+        array.array('d') with the same values distance_between_points would return.
+
+    Raises:
+        Exception: If the sequence arguments do not have the same length.
+        OverflowError: If the square of a finite coordinate difference overflows.
+    """
+    if np is not None:
+        _column_length(x1, y1, x2, y2)
+        x1, y1, x2, y2 = (np.asarray(column, dtype=float) for column in (x1, y1, x2, y2))
+        # dx * dx like distance_between_points, ** 2 would round differently from the scalar pow()
+        dx = x2 - x1
+        dy = y2 - y1
+        with np.errstate(over='ignore'):
+            dx_squared = dx * dx
+            dy_squared = dy * dy
+            distances = np.sqrt(dx_squared + dy_squared)
+
+        # Only a distance that is not finite can come from an overflowing square
+        if not np.isfinite(distances).all():
+            for difference, square in ((dx, dx_squared), (dy, dy_squared)):
+                if (np.isinf(square) & np.isfinite(difference)).any():
+                    raise OverflowError(34, 'Numerical result out of range')
+        return distances
+
+    return array('d', map(distance_between_points, *_broadcast_columns(x1, y1, x2, y2)))
@@ -0,0 +1,181 @@
+from heapq import heappush, heapreplace
+from itertools import chain
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from lab1 import distance_between_points, distance_between_points_batch
+
+
+Point = Tuple[float, float]
+
+
+def distance_matrix_chunks(points: Sequence[Point], others: Optional[Sequence[Point]] = None,
+                           chunk_size: int = 1024) -> Iterator[Tuple[int, List[List[float]]]]:
+    """
+    Compute the distance matrix between two point sets a block of rows at a time.
+
+    Only chunk_size rows of the matrix are held in memory at once, so the
+    full n x m matrix never has to fit in memory.
+
+    Args:
+        points (Sequence[Point]): The (x, y) points for the rows of the matrix.
+        others (Sequence[Point], optional): The (x, y) points for the columns.
+            Defaults to points itself.
+        chunk_size (int): The number of rows produced per chunk.
+
+    Returns:
+        Iterator[Tuple[int, List[List[float]]]]: Pairs of the index of the first
+        row in the chunk and the rows of distances in that chunk.
+
+    Raises:
+        Exception: If chunk_size is not a positive integer.
+    """
+    if type(chunk_size) is not int or chunk_size <= 0:
+        raise Exception("Invalid input")
+
+    if others is None:
+        others = points
+
+    xs = [x for x, _ in others]
+    ys = [y for _, y in others]
+
+    for start in range(0, len(points), chunk_size):
+        rows = [list(distance_between_points_batch(x, y, xs, ys)) if xs else []
+                for x, y in points[start:start + chunk_size]]
+        yield start, rows
+
+
+def distance_matrix(points: Sequence[Point], others: Optional[Sequence[Point]] = None,
+                    chunk_size: int = 1024) -> List[List[float]]:
+    """
+    Compute the full distance matrix between two point sets.
+
+    Args:
+        points (Sequence[Point]): The (x, y) points for the rows of the matrix.
+        others (Sequence[Point], optional): The (x, y) points for the columns.
+            Defaults to points itself.
+        chunk_size (int): The number of rows computed per chunk.
+
+    Returns:
+        List[List[float]]: matrix[i][j] is the distance between points[i] and others[j].
+    """
+    return list(chain.from_iterable(rows for _, rows in distance_matrix_chunks(points, others, chunk_size)))
+
+
+class KDTree:
+    """
+    A 2-d tree over a fixed set of points for nearest neighbour queries.
+
+    Distances are always computed with distance_between_points, so the
+    results match a brute force search over the same points exactly.
+    Ties on distance are broken by the lower point index.
+    """
+
+    def __init__(self, points: Sequence[Point]):
+        self.points = [(x, y) for x, y in points]
+        self.root = self._build(list(range(len(self.points))), 0)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _build(self, indices: List[int], axis: int) -> Optional[tuple]:
+        if not indices:
+            return None
+
+        indices.sort(key=lambda index: self.points[index][axis])
+        middle = len(indices) // 2
+        next_axis = 1 - axis
+
+        return (indices[middle], axis,
+                self._build(indices[:middle], next_axis),
+                self._build(indices[middle + 1:], next_axis))
+
+    def query(self, x: float, y: float, k: int = 1) -> List[Tuple[float, int]]:
+        """
+        Find the k points closest to (x, y).
+
+        Args:
+            x (float): The x-coordinate of the query point.
+            y (float): The y-coordinate of the query point.
+            k (int): The number of neighbours to return.
+
+        Returns:
+            List[Tuple[float, int]]: Up to k (distance, point index) pairs,
+            closest first.
+
+        Raises:
+            Exception: If k is not a positive integer.
+        """
+        if type(k) is not int or k <= 0:
+            raise Exception("Invalid input")
+
+        query_point = (x, y)
+        best = []  # heap of (-distance, -index), best[0] is the worst kept neighbour
+        stack = [(self.root, 0.0)]
+
+        while stack:
+            node, bound = stack.pop()
+            if node is None:
+                continue
+            if len(best) == k and bound > -best[0][0]:
+                continue
+
+            index, axis, left, right = node
+            px, py = self.points[index]
+            entry = (-distance_between_points(x, y, px, py), -index)
+
+            if len(best) < k:
+                heappush(best, entry)
+            elif entry > best[0]:
+                heapreplace(best, entry)
+
+            diff = query_point[axis] - self.points[index][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((far, abs(diff)))
+            stack.append((near, 0.0))
+
+        return sorted((-distance, -index) for distance, index in best)
+
+
+def nearest_neighbours(points: Sequence[Point], k: int = 1) -> List[List[Tuple[float, int]]]:
+    """
+    Find the k nearest other points for every point in the set.
+
+    Args:
+        points (Sequence[Point]): The (x, y) points.
+        k (int): The number of neighbours to find per point.
+
+    Returns:
+        List[List[Tuple[float, int]]]: For each point, up to k (distance, point index)
+        pairs, closest first. A point is never reported as its own neighbour.
+    """
+    if type(k) is not int or k <= 0:
+        raise Exception("Invalid input")
+
+    tree = KDTree(points)
+    neighbours = []
+
+    for i, (x, y) in enumerate(tree.points):
+        found = [pair for pair in tree.query(x, y, k + 1) if pair[1] != i]
+        neighbours.append(found[:k])
+
+    return neighbours
+
+
+def closest_pair(points: Sequence[Point]) -> Tuple[float, int, int]:
+    """
+    Find the two closest points in the set.
+
+    Args:
+        points (Sequence[Point]): The (x, y) points, at least two of them.
+
+    Returns:
+        Tuple[float, int, int]: The distance and the indices i < j of the closest pair.
+
+    Raises:
+        Exception: If fewer than two points are given.
+    """
+    if len(points) < 2:
+        raise Exception("Invalid input")
+
+    return min((found[0][0], min(i, found[0][1]), max(i, found[0][1]))
+               for i, found in enumerate(nearest_neighbours(points, 1)))
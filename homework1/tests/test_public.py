@@ -1,4 +1,12 @@
+import os
+import random
+import tempfile
+from array import array
+
 from lab1 import simple_interest, uppercase_count, distance_between_points
+from lab1 import simple_interest_batch, distance_between_points_batch
+from lab1 import uppercase_count_buffer, uppercase_count_file, uppercase_count_files
+from spatial import distance_matrix, nearest_neighbours, closest_pair
 
 def validate_simple_interest():
     test_cases = [
@@ -22,6 +30,25 @@ def validate_uppercase_count():
         result = uppercase_count(s)
         assert result == expected, f"Failed for string='{s}': {result} != {expected}"
 
+def validate_uppercase_count_streaming():
+    text = "DATA SCIence " * 50 + "Ünïcode ÀÉÎ ǅ straße " * 50
+    expected = uppercase_count(text)
+
+    for chunk_size in (1, 7, 4096):
+        result = uppercase_count_buffer(text.encode('utf-8'), chunk_size=chunk_size)
+        assert result == expected, f"Failed for chunk_size={chunk_size}: {result} != {expected}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_names = [os.path.join(directory, name) for name in ("text.txt", "empty.txt")]
+        with open(file_names[0], 'w', encoding='utf-8') as file_handle:
+            file_handle.write(text)
+        open(file_names[1], 'w').close()
+
+        assert uppercase_count_file(file_names[0], chunk_size=5) == expected, "Failed for mmap file"
+        assert uppercase_count_file(file_names[0], use_mmap=False) == expected, "Failed for chunked file"
+        result = uppercase_count_files(file_names, workers=2)
+        assert result == {file_names[0]: expected, file_names[1]: 0}, f"Failed for many files: {result}"
+
 def validate_distance_between_points():
     test_cases = [
         (1, 1, 4, 5, 5.0),
@@ -33,6 +60,84 @@ def validate_distance_between_points():
         result = distance_between_points(x1, y1, x2, y2)
         assert abs(result - expected) < 1e-2, f"Failed for points ({x1}, {y1}) to ({x2}, {y2}): {result} != {expected}"
 
+def validate_simple_interest_batch():
+    principals = array('d', [1000, 5, 500])
+    rates = array('d', [5, 5, 20])
+    years = array('d', [2, 5, 10])
+
+    result = simple_interest_batch(principals, rates, years)
+    for i in range(len(principals)):
+        expected = simple_interest(principals[i], rates[i], years[i])
+        assert result[i] == expected, f"Failed for row {i}: {result[i]} != {expected}"
+
+    result = simple_interest_batch(principals, 5, 2)
+    assert list(result) == [100.0, 0.5, 50.0], f"Failed for broadcast rate/years: {list(result)}"
+
+def validate_distance_between_points_batch():
+    x1, y1 = array('d', [1, 2, 3]), array('d', [1, 3, 4])
+    x2, y2 = array('d', [4, 5, 6]), array('d', [5, 7, 8])
+
+    result = distance_between_points_batch(x1, y1, x2, y2)
+    for i in range(len(x1)):
+        expected = distance_between_points(x1[i], y1[i], x2[i], y2[i])
+        assert result[i] == expected, f"Failed for row {i}: {result[i]} != {expected}"
+
+    result = distance_between_points_batch(0, 0, x2, y2)
+    assert abs(result[0] - 6.4031) < 1e-2, f"Failed for broadcast origin: {result[0]}"
+
+    rng = random.Random(0)
+    columns = [array('d', (rng.uniform(-1e6, 1e6) for _ in range(10000))) for _ in range(4)]
+    result = distance_between_points_batch(*columns)
+    for i, row in enumerate(zip(*columns)):
+        expected = distance_between_points(*row)
+        assert result[i] == expected, f"Failed for random row {i}: {result[i]} != {expected}"
+
+    # Like (x2 - x1) ** 2, an overflowing square raises instead of returning inf
+    for distance in (distance_between_points, distance_between_points_batch):
+        try:
+            distance(0, 0, 1e200, 0)
+        except OverflowError:
+            pass
+        else:
+            assert False, f"{distance.__name__} did not raise OverflowError"
+    # Only the squares raise, a sum of squares overflowing gives inf like before
+    assert distance_between_points(0, 0, 1e154, 1e154) == float('inf')
+    assert list(distance_between_points_batch(0, 0, array('d', [1e154]), 1e154)) == [float('inf')]
+    assert list(distance_between_points_batch(0, 0, array('d', [float('inf'), 3]), 4)) == [float('inf'), 5.0]
+
+    try:
+        distance_between_points_batch(x1, y1, x2, array('d', [5, 7]))
+    except Exception as error:
+        assert str(error) == "Invalid input", f"Failed for length mismatch: {error!r}"
+    else:
+        assert False, "Failed for length mismatch: no exception"
+
+SPATIAL_POINTS = [(0, 0), (3, 4), (1, 1), (10, 10), (-2, 5), (1, 1.5), (7, -3), (4, 4)]
+
+def validate_distance_matrix():
+    result = distance_matrix(SPATIAL_POINTS, chunk_size=3)
+    for i, (x1, y1) in enumerate(SPATIAL_POINTS):
+        for j, (x2, y2) in enumerate(SPATIAL_POINTS):
+            expected = distance_between_points(x1, y1, x2, y2)
+            assert result[i][j] == expected, f"Failed for pair ({i}, {j}): {result[i][j]} != {expected}"
+
+    rng = random.Random(1)
+    points = [(rng.uniform(-1e6, 1e6), rng.uniform(-1e6, 1e6)) for _ in range(300)]
+    result = distance_matrix(points, chunk_size=64)
+    for i, (x1, y1) in enumerate(points):
+        for j, (x2, y2) in enumerate(points):
+            expected = distance_between_points(x1, y1, x2, y2)
+            assert result[i][j] == expected, f"Failed for random pair ({i}, {j}): {result[i][j]} != {expected}"
+
+def validate_nearest_neighbours():
+    result = nearest_neighbours(SPATIAL_POINTS, 3)
+    for i, (x1, y1) in enumerate(SPATIAL_POINTS):
+        expected = sorted((distance_between_points(x1, y1, x2, y2), j)
+                          for j, (x2, y2) in enumerate(SPATIAL_POINTS) if j != i)[:3]
+        assert result[i] == expected, f"Failed for point {i}: {result[i]} != {expected}"
+
+    assert closest_pair(SPATIAL_POINTS) == (0.5, 2, 5), f"Failed for closest pair: {closest_pair(SPATIAL_POINTS)}"
+
 if __name__ == "__main__":
     print("Validating simple_interest...")
     validate_simple_interest()
@@ -42,6 +147,26 @@ if __name__ == "__main__":
     validate_uppercase_count()
     print("uppercase_count passed.")
 
+    print("Validating uppercase_count streaming...")
+    validate_uppercase_count_streaming()
+    print("uppercase_count streaming passed.")
+
     print("Validating distance_between_points...")
     validate_distance_between_points()
     print("distance_between_points passed.")
+
+    print("Validating simple_interest_batch...")
+    validate_simple_interest_batch()
+    print("simple_interest_batch passed.")
+
+    print("Validating distance_between_points_batch...")
+    validate_distance_between_points_batch()
+    print("distance_between_points_batch passed.")
+
+    print("Validating distance_matrix...")
+    validate_distance_matrix()
+    print("distance_matrix passed.")
+
+    print("Validating nearest_neighbours...")
+    validate_nearest_neighbours()
+    print("nearest_neighbours passed.")
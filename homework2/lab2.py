@@ -1,4 +1,29 @@
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+MIN_YEAR = 1000
+MAX_YEAR = 3000
+LEAP_YEARS = frozenset(
+    year for year in range(MIN_YEAR, MAX_YEAR + 1)
+    if (year % 400 == 0) or (year % 4 == 0 and year % 100 != 0)
+)
+
+
+@lru_cache(maxsize=1 << 16, typed=True)
+def _format_valid_date(day: int, month: int, year: int) -> str:
+    """
+    Build the 'DD Month, YYYY' string for a date that has already been validated.
+    Report exports repeat the same dates many times, so the strings are cached.
+    The cache is typed because 1, 1.0 and True are equal keys but format differently.
+    """
+    return f"{day:02} {MONTH_NAMES[month - 1]}, {year}"
+
 
 def format_date(day: int, month: int, year: int) -> str:
     """
@@ -15,34 +40,57 @@ def format_date(day: int, month: int, year: int) -> str:
     Raises:
         Exception: If the date provided is invalid (e.g., non-existent day, invalid month, or leap year issues).
     """
-    month_name = [
-        "January", "February", "March", "April", "May", "June", 
-        "July", "August", "September", "October", "November", "December"
-    ]
-    big_month = [1, 3, 5, 7, 8, 10, 12]
-    small_month = [4, 6, 9, 11]
-    
-    if day <= 0 or month <= 0 or month > 12:
+    if month <= 0 or month > 12 or year < MIN_YEAR or year > MAX_YEAR:
         raise Exception(f'The given date: {day}, {month}, {year} is invalid')
 
-    if month in big_month and day > 31:
-        raise Exception(f'The given date: {day}, {month}, {year} is invalid')
-    elif month in small_month and day > 30:
+    max_day = 29 if month == 2 and year in LEAP_YEARS else DAYS_IN_MONTH[month - 1]
+    if day <= 0 or day > max_day:
         raise Exception(f'The given date: {day}, {month}, {year} is invalid')
 
-    if year < 1000 or year > 3000:
-        raise Exception(f'The given date: {day}, {month}, {year} is invalid')
+    return _format_valid_date(day, month, year)
 
-    if month == 2:
-        if (year % 400 == 0) or (year % 4 == 0 and year % 100 != 0):
-            if day > 29:
-                raise Exception(f'The given date: {day}, {month}, {year} is invalid')
-        elif day > 28:
-            raise Exception(f'The given date: {day}, {month}, {year} is invalid')
-        
-    newmonth = month_name[month - 1]
-    newday = "{:02}".format(day)
-    return f"{newday} {newmonth}, {year}"
+
+def format_dates(dates: Iterable[Tuple[int, int, int]]) -> Iterator[Tuple[int, Optional[str]]]:
+    """
+    Formats a column of (day, month, year) dates lazily, one row at a time.
+    
+    Invalid rows do not stop the column: they are reported by their index
+    with None in place of the formatted date.
+    
+    Args:
+        dates (Iterable[Tuple[int, int, int]]): The (day, month, year) rows to format.
+    
+    Returns:
+        Iterator[Tuple[int, Optional[str]]]: The row index and its formatted date,
+        or None when the row is not a valid date.
+    """
+    for index, date in enumerate(dates):
+        try:
+            yield index, format_date(*date)
+        except Exception:
+            yield index, None
+
+
+def format_date_column(dates: Iterable[Tuple[int, int, int]]) -> Tuple[List[Optional[str]], List[int]]:
+    """
+    Formats a whole column of (day, month, year) dates.
+    
+    Args:
+        dates (Iterable[Tuple[int, int, int]]): The (day, month, year) rows to format.
+    
+    Returns:
+        Tuple[List[Optional[str]], List[int]]: The formatted dates, with None for
+        invalid rows, and the indices of the invalid rows.
+    """
+    formatted = []
+    invalid_rows = []
+
+    for index, value in format_dates(dates):
+        formatted.append(value)
+        if value is None:
+            invalid_rows.append(index)
+
+    return formatted, invalid_rows
 
 
 def check_palindrome_tuples(tups: List[Tuple[str, str]]) -> bool:
@@ -75,6 +123,95 @@ def check_palindrome_tuples(tups: List[Tuple[str, str]]) -> bool:
     return True
 
 
+def _is_valid_palindrome_item(item_tups: Tuple[str, str]) -> bool:
+    """
+    Check one item against the input rules of check_palindrome_tuples.
+    """
+    return (type(item_tups) is tuple and len(item_tups) == 2
+            and type(item_tups[0]) is str and len(item_tups[0]) > 1
+            and type(item_tups[1]) is str and len(item_tups[1]) > 1)
+
+
+def _is_palindrome_pair(first: str, second: str) -> bool:
+    """
+    Check that second is first reversed. The length check skips the reversed copy for most mismatches.
+    """
+    return len(first) == len(second) and second == first[::-1]
+
+
+def check_palindrome_stream(tups: Iterable[Tuple[str, str]]) -> bool:
+    """
+    Checks if all tuples are palindromic pairs in a single pass over any iterable.
+    
+    Unlike check_palindrome_tuples, each tuple is validated and compared as it
+    arrives, and the check stops at the first mismatch. Tuples after the
+    first mismatch are therefore never validated or consumed.
+    
+    Args:
+        tups (Iterable[Tuple[str, str]]): A list, generator or other iterable of string pairs.
+    
+    Returns:
+        bool: True if all tuples are palindromic pairs, otherwise False.
+    
+    Raises:
+        Exception: If the input is invalid (e.g., not iterable, tuples are not of length 2, or not strings).
+    """
+    if isinstance(tups, (str, bytes)):
+        raise Exception("Invalid Input")
+
+    try:
+        items = iter(tups)
+    except TypeError:
+        raise Exception("Invalid Input")
+
+    for item_tups in items:
+        if not _is_valid_palindrome_item(item_tups):
+            raise Exception("Invalid Input")
+
+        if not _is_palindrome_pair(*item_tups):
+            return False
+    return True
+
+
+def check_palindrome_tuples_parallel(tups: List[Tuple[str, str]], workers: Optional[int] = None,
+                                     chunk_size: int = 100000) -> bool:
+    """
+    Checks if all tuples in an in-memory list are palindromic pairs with a process pool.
+    
+    The list is split into chunks that are checked with check_palindrome_stream
+    in worker processes. Chunks are inspected in order, so the result (or the
+    exception) is the same as check_palindrome_stream on the whole list, and
+    the remaining chunks are cancelled once a mismatch is found.
+    
+    Args:
+        tups (List[Tuple[str, str]]): A list of tuples where each tuple contains two strings.
+        workers (int, optional): The number of worker processes. Defaults to the CPU count.
+        chunk_size (int): The number of tuples checked per task.
+    
+    Returns:
+        bool: True if all tuples are palindromic pairs, otherwise False.
+    
+    Raises:
+        Exception: If the input is invalid (e.g., not a list, tuples are not of length 2, or not strings).
+    """
+    if type(tups) is not list or type(chunk_size) is not int or chunk_size <= 0:
+        raise Exception("Invalid Input")
+
+    if len(tups) <= chunk_size:
+        return check_palindrome_stream(tups)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(check_palindrome_stream, tups[start:start + chunk_size])
+                   for start in range(0, len(tups), chunk_size)]
+
+        for future in futures:
+            if not future.result():
+                for pending in futures:
+                    pending.cancel()
+                return False
+    return True
+
+
 def join_by_delimiter(substrings: List[str], delimiter: str) -> str:
     """
     Joins substrings using a specified delimiter.
@@ -89,27 +226,93 @@ def join_by_delimiter(substrings: List[str], delimiter: str) -> str:
     Raises:
         Exception: If the input is invalid (e.g., delimiter is not a single character, substrings is not a list).
     """
-    temp = ""
-    
     if type(delimiter) is not str or len(delimiter) > 1:
         raise Exception("Invalid Input")
     
     if type(substrings) is not list:
         raise Exception("Invalid Input")
     
-    if len(substrings) > 1:
-        for i in range(len(substrings)):
-            if type(substrings[i]) is not str:
-                raise Exception("Invalid Input")
+    if len(substrings) == 1:
+        return substrings[0]
+
+    for item_string in substrings:
+        if type(item_string) is not str:
+            raise Exception("Invalid Input")
+
+    return delimiter.join(substrings)
 
-            if i == len(substrings) - 1:
-                temp += substrings[i]
-            else:
-                temp += substrings[i] + delimiter
-        return temp
+
+def iter_join_by_delimiter(substrings: Iterable[str], delimiter: str, batch_size: int = 4096) -> Iterator[str]:
+    """
+    Joins substrings from any iterable lazily, yielding the result in pieces.
     
-    elif len(substrings) == 0:
-        return ""
-        
-    elif len(substrings) == 1:
-        return substrings[0]
+    Concatenating the yielded pieces gives the same string as join_by_delimiter.
+    Substrings are joined batch_size at a time, so memory stays bounded by one batch.
+    The delimiter and batch_size are checked when the function is called; a
+    substring that is not a string is reported when its batch is reached.
+    
+    Args:
+        substrings (Iterable[str]): The substrings to be joined, e.g. a generator.
+        delimiter (str): A single-character string used to join the substrings.
+        batch_size (int): The number of substrings joined per yielded piece.
+    
+    Returns:
+        Iterator[str]: Consecutive pieces of the joined string.
+    
+    Raises:
+        Exception: If the input is invalid (e.g., delimiter is not a single character, a substring is not a string).
+    """
+    if type(delimiter) is not str or len(delimiter) > 1:
+        raise Exception("Invalid Input")
+
+    if isinstance(substrings, str) or type(batch_size) is not int or batch_size <= 0:
+        raise Exception("Invalid Input")
+
+    try:
+        substrings = iter(substrings)
+    except TypeError:
+        raise Exception("Invalid Input")
+
+    return _iter_join_batches(substrings, delimiter, batch_size)
+
+
+def _iter_join_batches(substrings: Iterator[str], delimiter: str, batch_size: int) -> Iterator[str]:
+    batch = []
+    first = True
+
+    for item_string in substrings:
+        if type(item_string) is not str:
+            raise Exception("Invalid Input")
+
+        batch.append(item_string)
+        if len(batch) == batch_size:
+            yield delimiter.join(batch) if first else delimiter + delimiter.join(batch)
+            batch = []
+            first = False
+
+    if batch:
+        yield delimiter.join(batch) if first else delimiter + delimiter.join(batch)
+
+
+def write_join_by_delimiter(substrings: Iterable[str], delimiter: str, output: TextIO,
+                            batch_size: int = 4096) -> int:
+    """
+    Joins substrings from any iterable and writes the result straight to a file-like object.
+    
+    Args:
+        substrings (Iterable[str]): The substrings to be joined, e.g. a generator.
+        delimiter (str): A single-character string used to join the substrings.
+        output (TextIO): An object with a write method, such as an open text file.
+        batch_size (int): The number of substrings joined per write call.
+    
+    Returns:
+        int: The number of characters written.
+    
+    Raises:
+        Exception: If the input is invalid (e.g., delimiter is not a single character, a substring is not a string).
+    """
+    written = 0
+    for piece in iter_join_by_delimiter(substrings, delimiter, batch_size):
+        output.write(piece)
+        written += len(piece)
+    return written
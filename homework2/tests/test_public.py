@@ -1,4 +1,9 @@
+import io
+
 from lab2 import format_date, check_palindrome_tuples, join_by_delimiter
+from lab2 import format_dates, format_date_column
+from lab2 import check_palindrome_stream, check_palindrome_tuples_parallel
+from lab2 import iter_join_by_delimiter, write_join_by_delimiter
 
 def test_format_date():
     """
@@ -16,6 +21,21 @@ def test_format_date():
         except Exception as e:
             print(e)  # Expected: Exception message indicating invalid date
 
+def test_format_dates():
+    """
+    Test the format_dates and format_date_column batch functions.
+    """
+    dates = [(1, 8, 2000), (29, 2, 2003), (29, 2, 2004), "not a date"]
+    print(list(format_dates(dates)))  # Expected: [(0, '01 August, 2000'), (1, None), (2, '29 February, 2004'), (3, None)]
+
+    formatted, invalid_rows = format_date_column(dates)
+    assert formatted == ['01 August, 2000', None, '29 February, 2004', None]
+    assert invalid_rows == [1, 3]
+
+    # Equal keys of different types must not share a cached string
+    assert format_date(1.0, 8, 2000) == "1.0 August, 2000"
+    assert format_date(1, 8, 2000) == "01 August, 2000"
+
 def test_check_palindrome_tuples():
     """
     Test the check_palindrome_tuples function with valid and invalid inputs.
@@ -37,6 +57,22 @@ def test_check_palindrome_tuples():
         except Exception as e:
             print(e)  # Expected: Exception message indicating invalid input
 
+def test_check_palindrome_stream():
+    """
+    Test the single-pass and parallel palindrome checks against check_palindrome_tuples.
+    """
+    pairs = [("abc", "cba"), ("madam", "madam")] * 50
+    print(check_palindrome_stream(pair for pair in pairs))  # Expected: True
+    print(check_palindrome_stream(iter([("abc", "def"), (123, "321")])))  # Expected: False, stops before the invalid tuple
+    assert check_palindrome_tuples_parallel(pairs, workers=2, chunk_size=7) == check_palindrome_tuples(pairs)
+    assert check_palindrome_tuples_parallel(pairs + [("ab", "ab")], workers=2, chunk_size=7) is False
+
+    for invalid_input in ["abc, cba", [("abc", "cba", "extra")], [("", "cba")]]:
+        try:
+            print(check_palindrome_stream(invalid_input))
+        except Exception as e:
+            print(e)  # Expected: Exception message indicating invalid input
+
 def test_join_by_delimiter():
     """
     Test the join_by_delimiter function with valid and invalid inputs.
@@ -59,7 +95,37 @@ def test_join_by_delimiter():
         except Exception as e:
             print(e)  # Expected: Exception message indicating invalid input
 
+def test_write_join_by_delimiter():
+    """
+    Test the streaming join functions against join_by_delimiter.
+    """
+    words = ["this", "is", "DSCI", "510"] * 25
+    expected = join_by_delimiter(words, " ")
+    assert "".join(iter_join_by_delimiter(iter(words), " ", batch_size=3)) == expected
+    assert "".join(iter_join_by_delimiter([], ",")) == ""
+
+    output = io.StringIO()
+    print(write_join_by_delimiter((word for word in words[:4]), ",", output))  # Expected: 16
+    print(output.getvalue())  # Expected: "this,is,DSCI,510"
+
+    try:
+        print(write_join_by_delimiter(["wrong", 5], ",", io.StringIO()))
+    except Exception as e:
+        print(e)  # Expected: Exception message indicating invalid input
+
+    # Bad arguments are reported by the call itself, not by the first next()
+    for substrings, delimiter in ((words, "::"), (5, ","), ("text", ",")):
+        try:
+            iter_join_by_delimiter(substrings, delimiter)
+        except Exception as e:
+            print(e)  # Expected: Invalid Input
+        else:
+            assert False, f"iter_join_by_delimiter did not raise for {substrings!r}, {delimiter!r}"
+
 # Call the test functions to execute the tests
 test_format_date()
+test_format_dates()
 test_check_palindrome_tuples()
+test_check_palindrome_stream()
 test_join_by_delimiter()
+test_write_join_by_delimiter()
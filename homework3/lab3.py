@@ -1,4 +1,44 @@
+import re
 import string
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import combinations_with_replacement, islice
+from math import prod
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+DIGIT_BLOCK_SIZE = 4
+DIGIT_BLOCK = 10 ** DIGIT_BLOCK_SIZE
+# Digit products of every 0..9999 block: padded with leading zeros for inner
+# blocks of a number, unpadded for its leading block.
+PADDED_BLOCK_PRODUCTS = array('L', (prod(map(int, f"{i:0{DIGIT_BLOCK_SIZE}}")) for i in range(DIGIT_BLOCK)))
+LEADING_BLOCK_PRODUCTS = array('L', (prod(map(int, str(i))) for i in range(DIGIT_BLOCK)))
+
+
+def _digit_product(num: int) -> int:
+    """
+    Multiply the digits of a non-negative integer, four digits per table lookup.
+    """
+    product = 1
+    while num >= DIGIT_BLOCK:
+        num, block = divmod(num, DIGIT_BLOCK)
+        product *= PADDED_BLOCK_PRODUCTS[block]
+        if product == 0:
+            return 0
+    return product * LEADING_BLOCK_PRODUCTS[num]
+
+
+@lru_cache(maxsize=None)
+def _cached_persistence(num: int) -> int:
+    """
+    Persistence of a digit product. After one step every number collapses into
+    the small set of products of digits, so these are memoized without bound.
+    """
+    if num < 10:
+        return 0
+    return 1 + _cached_persistence(_digit_product(num))
 
 
 def compute_persistence(num: int) -> int:
@@ -19,21 +59,89 @@ def compute_persistence(num: int) -> int:
     """
     if type(num) is not int or num < 0:
         raise Exception("Invalid input")
-    
-    steps = 0
-    temp_num = num
-    
-    while(temp_num >= 10):
-        product = 1
-        
-        while temp_num > 0:
-            product *= (temp_num % 10)
-            temp_num = temp_num // 10
-        
-        temp_num = product 
-        steps += 1            
-        
-    return steps
+
+    if num < 10:
+        return 0
+    return 1 + _cached_persistence(_digit_product(num))
+
+
+def persistence_range(start: int, stop: int) -> array:
+    """
+    Compute the persistence of every number in range(start, stop).
+
+    Numbers are walked one block of 10000 at a time: the digit product of the
+    high part is computed once per block and combined with the table entry of
+    each low part, so every number costs one multiplication and a cache hit.
+
+    Args:
+        start (int): The first number. It must be a non-negative integer.
+        stop (int): The end of the range (exclusive). It must be at least start.
+
+    Returns:
+        array: An array('B') where item i is the persistence of start + i.
+
+    Raises:
+        Exception: If the inputs are not non-negative integers with start <= stop.
+    """
+    if type(start) is not int or type(stop) is not int or start < 0 or stop < start:
+        raise Exception("Invalid input")
+
+    result = array('B')
+    num = start
+
+    while num < stop:
+        high, low = divmod(num, DIGIT_BLOCK)
+        block_stop = min(stop - high * DIGIT_BLOCK, DIGIT_BLOCK)
+
+        if high == 0:
+            result.extend(0 if i < 10 else 1 + _cached_persistence(LEADING_BLOCK_PRODUCTS[i])
+                          for i in range(low, block_stop))
+        else:
+            high_product = _digit_product(high)
+            result.extend(1 + _cached_persistence(high_product * product)
+                          for product in PADDED_BLOCK_PRODUCTS[low:block_stop])
+
+        num = high * DIGIT_BLOCK + block_stop
+
+    return result
+
+
+def persistence_range_parallel(start: int, stop: int, workers: Optional[int] = None,
+                               chunk_size: int = 1000000) -> array:
+    """
+    Compute the persistence of every number in range(start, stop) with a process pool.
+
+    The range is split into chunks of chunk_size numbers that are handed to
+    persistence_range in worker processes and concatenated in order.
+
+    Args:
+        start (int): The first number. It must be a non-negative integer.
+        stop (int): The end of the range (exclusive). It must be at least start.
+        workers (int, optional): The number of worker processes. Defaults to the CPU count.
+        chunk_size (int): The number of values computed per task.
+
+    Returns:
+        array: An array('B') where item i is the persistence of start + i.
+
+    Raises:
+        Exception: If the inputs are not non-negative integers with start <= stop.
+    """
+    if type(start) is not int or type(stop) is not int or start < 0 or stop < start:
+        raise Exception("Invalid input")
+    if type(chunk_size) is not int or chunk_size <= 0:
+        raise Exception("Invalid input")
+
+    if stop - start <= chunk_size:
+        return persistence_range(start, stop)
+
+    starts = range(start, stop, chunk_size)
+    stops = [min(chunk_start + chunk_size, stop) for chunk_start in starts]
+
+    result = array('B')
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in executor.map(persistence_range, starts, stops):
+            result.extend(chunk)
+    return result
 
 
 def is_digit_power_sum(num: int, power: int) -> bool:
@@ -66,6 +174,91 @@ def is_digit_power_sum(num: int, power: int) -> bool:
     return sums == num
 
 
+@lru_cache(maxsize=None)
+def _digit_power_sums_of_length(length: int, power: int) -> Tuple[int, ...]:
+    """
+    All numbers with exactly length digits that equal the sum of their digits
+    raised to power. Only digit multisets are enumerated: the sum of a multiset
+    is a candidate, and it is a solution when its own digits form that multiset.
+    Zero is left out, is_digit_power_sum treats it as having no digits.
+    """
+    powers = {digit: int(digit) ** power for digit in string.digits}
+    found = []
+
+    for digits in combinations_with_replacement(string.digits, length):
+        total = sum(map(powers.__getitem__, digits))
+        total_digits = str(total)
+        if total and len(total_digits) == length and ''.join(sorted(total_digits)) == ''.join(digits):
+            found.append(total)
+
+    return tuple(sorted(found))
+
+
+def _check_search_input(limit: int, power: int) -> None:
+    if type(limit) is not int or type(power) is not int:
+        raise Exception("Invalid input")
+    if limit < 0 or power < 0:
+        raise Exception("Invalid input")
+
+
+def find_digit_power_sums(limit: int, power: int) -> List[int]:
+    """
+    Find every number below limit that is_digit_power_sum accepts for the given power.
+
+    Instead of testing every integer, each multiset of digits is tried once
+    (combinations with replacement) against a precomputed table of digit
+    powers, which makes limits like 10**10 practical. Results are cached per
+    number of digits and power, so repeated searches are free.
+
+    Args:
+        limit (int): The end of the search range (exclusive). It must be a non-negative integer.
+        power (int): The power to which each digit is raised. It must be a non-negative integer.
+
+    Returns:
+        List[int]: The matching numbers in increasing order.
+
+    Raises:
+        Exception: If the inputs are not non-negative integers.
+    """
+    _check_search_input(limit, power)
+
+    found = [0] if limit > 0 else []
+    for length in range(1, len(str(max(limit - 1, 0))) + 1):
+        found.extend(num for num in _digit_power_sums_of_length(length, power) if num < limit)
+    return found
+
+
+def find_digit_power_sums_parallel(limit: int, powers: List[int],
+                                   workers: Optional[int] = None) -> Dict[int, List[int]]:
+    """
+    Run find_digit_power_sums for several powers with a process pool.
+
+    Every (number of digits, power) pair is searched as a separate task.
+
+    Args:
+        limit (int): The end of the search range (exclusive). It must be a non-negative integer.
+        powers (List[int]): The powers to search. Each must be a non-negative integer.
+        workers (int, optional): The number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        Dict[int, List[int]]: The matching numbers in increasing order for every power.
+
+    Raises:
+        Exception: If the inputs are not non-negative integers.
+    """
+    for power in powers:
+        _check_search_input(limit, power)
+
+    lengths = range(1, len(str(max(limit - 1, 0))) + 1)
+    tasks = [(length, power) for power in powers for length in lengths]
+
+    found = {power: [0] if limit > 0 else [] for power in powers}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for (length, power), nums in zip(tasks, executor.map(_digit_power_sums_of_length, *zip(*tasks))):
+            found[power].extend(num for num in nums if num < limit)
+    return found
+
+
 def is_valid_product_code(code: str) -> bool:
     """
     Check if the product code is valid.
@@ -109,3 +302,106 @@ def is_valid_product_code(code: str) -> bool:
             return False
         
     return uppercase >= 2 and digit >= 3 and dash == 1
+
+
+# ASCII product codes: 12 characters, letters, digits and exactly one inner
+# dash, with at least two uppercase letters and three digits.
+ASCII_PRODUCT_CODE = re.compile(
+    r"(?=(?:[^A-Z]*[A-Z]){2})(?=(?:[^0-9]*[0-9]){3})[A-Za-z0-9]+-[A-Za-z0-9]+"
+)
+
+
+def _is_valid_product_code_fast(code: str) -> bool:
+    """
+    is_valid_product_code for strings that are known to be str. Pure ASCII
+    codes are matched with a precompiled regex, anything else falls back to
+    the character loop so Unicode isupper/isdigit/isalnum semantics are kept.
+    """
+    if len(code) != 12:
+        return False
+    if code.isascii():
+        return ASCII_PRODUCT_CODE.fullmatch(code) is not None
+    return is_valid_product_code(code)
+
+
+def validate_product_codes(codes: Iterable[str]) -> Iterator[bool]:
+    """
+    Validate a stream of product codes lazily.
+
+    Args:
+        codes (Iterable[str]): The product codes, e.g. a list or a generator.
+
+    Returns:
+        Iterator[bool]: The is_valid_product_code result for each code, in order.
+
+    Raises:
+        Exception: If one of the codes is not a string.
+    """
+    for code in codes:
+        if type(code) is not str:
+            raise Exception("Invalid input")
+        yield _is_valid_product_code_fast(code)
+
+
+def _invalid_product_code_lines(first_line: int, lines: List[str]) -> List[int]:
+    """
+    Line numbers of the invalid codes in a block of lines starting at first_line.
+    """
+    return [line_number for line_number, line in enumerate(lines, first_line)
+            if not _is_valid_product_code_fast(line.rstrip('\r\n'))]
+
+
+def find_invalid_product_codes(file_name: str, workers: int = 1, chunk_size: int = 100000) -> Iterator[int]:
+    """
+    Validate a file with one product code per line and report the invalid ones.
+
+    The file is streamed in blocks of chunk_size lines. With more than one
+    worker the blocks are validated in a process pool, with a bounded number
+    of blocks in flight, and the line numbers are still reported in order.
+    The arguments are checked and the file is opened when the function is
+    called, not when the first line number is requested.
+
+    Args:
+        file_name (str): The path of the file with one product code per line.
+        workers (int): The number of worker processes. 1 validates in the current process.
+        chunk_size (int): The number of lines per block.
+
+    Returns:
+        Iterator[int]: The 1-based line numbers of the invalid product codes.
+
+    Raises:
+        Exception: If the file does not exist.
+    """
+    if type(workers) is not int or workers <= 0 or type(chunk_size) is not int or chunk_size <= 0:
+        raise Exception("Invalid input")
+
+    try:
+        file_handle = open(file_name, 'r')
+    except FileNotFoundError:
+        raise Exception("File Not Found")
+
+    return _iter_invalid_product_codes(file_handle, workers, chunk_size)
+
+
+def _iter_invalid_product_codes(file_handle, workers: int, chunk_size: int) -> Iterator[int]:
+    with file_handle:
+        blocks = iter(lambda: list(islice(file_handle, chunk_size)), [])
+
+        if workers == 1:
+            first_line = 1
+            for lines in blocks:
+                yield from _invalid_product_code_lines(first_line, lines)
+                first_line += len(lines)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            first_line = 1
+            for lines in blocks:
+                pending.append(executor.submit(_invalid_product_code_lines, first_line, lines))
+                first_line += len(lines)
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
@@ -1,4 +1,10 @@
+import os
+import tempfile
+
 from lab3 import compute_persistence, is_digit_power_sum, is_valid_product_code
+from lab3 import persistence_range, persistence_range_parallel
+from lab3 import find_digit_power_sums, find_digit_power_sums_parallel
+from lab3 import validate_product_codes, find_invalid_product_codes
 
 def compute_persistence(num: int) -> int:
     """
@@ -88,11 +94,21 @@ print(compute_persistence(39))  # Expected: 3
 print(compute_persistence(999))  # Expected: 4
 print(compute_persistence(4))  # Expected: 0
 
+# Test `persistence_range`
+print(list(persistence_range(37, 40)))  # Expected: [2, 2, 3]
+assert list(persistence_range(0, 20000)) == [compute_persistence(num) for num in range(0, 20000)]
+assert list(persistence_range_parallel(9000, 31000, workers=2, chunk_size=5000)) == list(persistence_range(9000, 31000))
+
 # Test `is_digit_power_sum`
 print(is_digit_power_sum(153, 3))  # Expected: True
 print(is_digit_power_sum(9474, 4))  # Expected: True
 print(is_digit_power_sum(12, 3))  # Expected: False
 
+# Test `find_digit_power_sums`
+print(find_digit_power_sums(1000, 3))  # Expected: [0, 1, 153, 370, 371, 407]
+assert find_digit_power_sums(20000, 4) == [num for num in range(20000) if is_digit_power_sum(num, 4)]
+assert find_digit_power_sums_parallel(20000, [3, 4], workers=2) == {3: find_digit_power_sums(20000, 3), 4: find_digit_power_sums(20000, 4)}
+
 # Test `is_valid_product_code`
 print(is_valid_product_code("A1B-3456CDEF"))  # Expected: True
 print(is_valid_product_code("AbCD1234567-"))  # Expected: False
@@ -100,3 +116,23 @@ print(is_valid_product_code("a1-Bc2DEf34g"))  # Expected: True
 print(is_valid_product_code("A1Bc2DeF34"))  # Expected: False
 print(is_valid_product_code("ABCDE12-FGHI"))  # Expected: False
 print(is_valid_product_code("&A907y_Chj-FGHI"))  # Expected: False
+
+# Test `validate_product_codes` and `find_invalid_product_codes`
+product_codes = ["A1B-3456CDEF", "AbCD1234567-", "a1-Bc2DEf34g", "A1Bc2DeF34", "ÀÉ1-2345abcd"]
+print(list(validate_product_codes(product_codes)))  # Expected: [True, False, True, False, True]
+
+with tempfile.TemporaryDirectory() as directory:
+    codes_file = os.path.join(directory, "codes.txt")
+    with open(codes_file, "w") as file_handle:
+        file_handle.write("\n".join(product_codes * 3) + "\n")
+
+    print(list(find_invalid_product_codes(codes_file)))  # Expected: [2, 4, 7, 9, 12, 14]
+    assert list(find_invalid_product_codes(codes_file, workers=2, chunk_size=4)) == [2, 4, 7, 9, 12, 14]
+
+    # A missing file is reported by the call itself, before any line number is requested
+    try:
+        find_invalid_product_codes(os.path.join(directory, "missing.txt"))
+    except Exception as e:
+        print(e)  # Expected: File Not Found
+    else:
+        assert False, "find_invalid_product_codes did not raise for a missing file"
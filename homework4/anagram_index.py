@@ -0,0 +1,172 @@
+import os
+import sqlite3
+from typing import Iterator, List, Optional, Tuple
+
+from lab4 import PUNCTUATION_TABLE, TEXT_ENCODING, TEXT_ERRORS, file_fingerprint
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS words (
+    signature TEXT NOT NULL,
+    word TEXT NOT NULL,
+    path TEXT NOT NULL,
+    line_start INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS words_by_signature ON words (signature, word);
+CREATE INDEX IF NOT EXISTS words_by_path ON words (path, line_start);
+"""
+
+
+def _signature(word: str) -> str:
+    return ''.join(sorted(word))
+
+
+class AnagramIndex:
+    """
+    An on-disk index from sorted-letter signatures to the words of whole files.
+
+    Words are decoded and normalized like anagram_finder does: lower-cased
+    with the punctuation removed. The index lives in an SQLite database, so it is
+    reloaded for free by opening the same path again. update() compares the
+    size, mtime and a fingerprint of every file with what was indexed: unchanged
+    files are skipped, appended files are only read from where indexing
+    stopped, and any other change re-indexes the file.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> 'AnagramIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _file_record(self, path: str) -> Optional[Tuple[int, int, int, str]]:
+        return self.connection.execute(
+            "SELECT size, mtime_ns, offset, fingerprint FROM files WHERE path = ?", (path,)
+        ).fetchone()
+
+    def update(self, *file_names: str) -> int:
+        """
+        Bring the index up to date with the given files.
+
+        Args:
+            *file_names (str): The paths of the text files to index.
+
+        Returns:
+            int: The number of lines read from the files.
+
+        Raises:
+            Exception: If one of the files does not exist.
+        """
+        lines_read = 0
+        for file_name in file_names:
+            lines_read += self._update_file(os.path.abspath(file_name))
+        return lines_read
+
+    def _update_file(self, path: str) -> int:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise Exception("File Not Found")
+
+        record = self._file_record(path)
+        if record is not None and record[0] == stat.st_size and record[1] == stat.st_mtime_ns:
+            return 0
+
+        with open(path, 'rb') as file_handle, self.connection:
+            resume = 0
+            if record is not None and stat.st_size >= record[2] \
+                    and file_fingerprint(file_handle, record[2]) == record[3]:
+                resume = record[2]
+
+            # Lines starting at or after the resume offset are indexed again,
+            # which also replaces a previously unterminated last line.
+            self.connection.execute("DELETE FROM words WHERE path = ? AND line_start >= ?", (path, resume))
+
+            file_handle.seek(resume)
+            line_start = resume
+            offset = resume
+            lines_read = 0
+            rows = []
+
+            for line in file_handle:
+                words = line.decode(TEXT_ENCODING, TEXT_ERRORS).lower().translate(PUNCTUATION_TABLE).split()
+                rows.extend((_signature(word), word, path, line_start) for word in words)
+                line_start += len(line)
+                lines_read += 1
+                if line.endswith(b'\n'):
+                    offset = line_start
+
+                if len(rows) >= 10000:
+                    self.connection.executemany("INSERT INTO words VALUES (?, ?, ?, ?)", rows)
+                    rows = []
+
+            self.connection.executemany("INSERT INTO words VALUES (?, ?, ?, ?)", rows)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                (path, line_start, stat.st_mtime_ns, offset, file_fingerprint(file_handle, offset))
+            )
+
+        return lines_read
+
+    def remove(self, file_name: str) -> None:
+        """
+        Drop a file and its words from the index.
+
+        Args:
+            file_name (str): The path of the indexed file.
+        """
+        path = os.path.abspath(file_name)
+        with self.connection:
+            self.connection.execute("DELETE FROM words WHERE path = ?", (path,))
+            self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def anagrams(self, word: str) -> List[str]:
+        """
+        Find the indexed words that are anagrams of a word.
+
+        Args:
+            word (str): The word to look up. It is normalized like the indexed words.
+
+        Returns:
+            List[str]: The other indexed words with the same letters, sorted.
+        """
+        word = word.lower().translate(PUNCTUATION_TABLE).strip()
+        rows = self.connection.execute(
+            "SELECT DISTINCT word FROM words WHERE signature = ? AND word != ? ORDER BY word",
+            (_signature(word), word)
+        )
+        return [row[0] for row in rows]
+
+    def groups(self, min_size: int = 2) -> Iterator[List[str]]:
+        """
+        Iterate over all groups of indexed words that are anagrams of each other.
+
+        Args:
+            min_size (int): The smallest number of distinct words in a reported group.
+
+        Returns:
+            Iterator[List[str]]: The sorted words of each group, ordered by signature.
+        """
+        rows = self.connection.execute(
+            "SELECT signature, group_concat(word, ' ') FROM "
+            "(SELECT DISTINCT signature, word FROM words) "
+            "GROUP BY signature HAVING count(*) >= ? ORDER BY signature",
+            (min_size,)
+        )
+        for _, words in rows:
+            yield sorted(words.split(' '))
@@ -0,0 +1,78 @@
+import os
+import random
+import string
+import tempfile
+import time
+
+from lab4 import COMPRESSED_OPENERS, anagram_finder, find_max_in_lines, open_text, zstandard
+
+
+def make_anagram_lines(file_name: str, line_count: int, words_per_line: int, seed: int = 0) -> None:
+    """
+    Write a synthetic anagram_finder input: lines of random short words with
+    punctuation, so many words share their sorted letters with another word.
+    """
+    rng = random.Random(seed)
+    letters = string.ascii_letters[:8]
+
+    with open(file_name, 'w') as file_handle:
+        for _ in range(line_count):
+            words = [''.join(rng.choices(letters, k=rng.randint(3, 7))) + rng.choice(('', '', ',', '!'))
+                     for _ in range(words_per_line)]
+            file_handle.write(' '.join(words) + '\n')
+
+
+def benchmark_anagram_finder(word_counts=(10000, 30000, 100000), line_count: int = 5) -> None:
+    """
+    Time anagram_finder on lines of 10k to 100k words and print the throughput.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for words_per_line in word_counts:
+            file_name = os.path.join(directory, f"words_{words_per_line}.txt")
+            make_anagram_lines(file_name, line_count, words_per_line)
+
+            start = time.perf_counter()
+            anagram_finder(file_name)
+            elapsed = time.perf_counter() - start
+
+            total_words = words_per_line * line_count
+            print(f"anagram_finder: {line_count} lines x {words_per_line} words "
+                  f"in {elapsed:.3f}s ({total_words / elapsed:,.0f} words/s)")
+
+
+def make_number_lines(file_name: str, line_count: int, values_per_line: int, seed: int = 0) -> None:
+    """
+    Write a synthetic find_max_in_lines input of comma-separated integers.
+    The file may be compressed, see open_text.
+    """
+    rng = random.Random(seed)
+
+    with open_text(file_name, 'w') as file_handle:
+        for _ in range(line_count):
+            file_handle.write(','.join(str(rng.randint(-10 ** 6, 10 ** 6)) for _ in range(values_per_line)) + '\n')
+
+
+def benchmark_compressed_input(line_count: int = 2000, values_per_line: int = 1000) -> None:
+    """
+    Time find_max_in_lines on the same numbers stored plain and compressed and print the throughput.
+    """
+    extensions = [''] + [extension for extension in COMPRESSED_OPENERS
+                         if extension != '.zst' or zstandard is not None]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in extensions:
+            file_name = os.path.join(directory, f"numbers.txt{extension}")
+            make_number_lines(file_name, line_count, values_per_line)
+
+            start = time.perf_counter()
+            find_max_in_lines(file_name)
+            elapsed = time.perf_counter() - start
+
+            size = os.path.getsize(file_name)
+            print(f"find_max_in_lines: {extension or 'plain':6} {size / 2 ** 20:7.2f} MiB on disk "
+                  f"in {elapsed:.3f}s ({line_count * values_per_line / elapsed:,.0f} values/s)")
+
+
+if __name__ == "__main__":
+    benchmark_anagram_finder()
+    benchmark_compressed_input()
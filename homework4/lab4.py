@@ -1,6 +1,108 @@
+import bz2
+import csv
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import mmap
 import os
+import re
 import string
-from typing import List
+import time
+import warnings
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, blocks are parsed with int() without it
+    np = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional, only needed for .zst files
+    zstandard = None
+
+INT64_MAX = 2 ** 63 - 1
+INT64_MIN = -2 ** 63
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+WRITE_BUFFER_SIZE = 1 << 20
+READ_BLOCK_SIZE = 1 << 24
+DEFAULT_LOG_LEVELS = {'ERROR': 'error', 'INFO': 'info', 'WARNING': 'warning'}
+BLANK_FIELD = re.compile(rb"(?:^|,)\s*(?=,|$)")
+LOG_TIMESTAMP = re.compile(r"\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?)\]?:?\s*")
+EPOCH = datetime(1970, 1, 1)
+FINGERPRINT_SIZE = 4096
+# The anagram finders and the anagram index decode their input the same way,
+# undecodable bytes become U+FFFD instead of aborting the run.
+TEXT_ENCODING = 'utf-8'
+TEXT_ERRORS = 'replace'
+
+
+def _zstd_open(file_name: str, mode: str, **kwargs) -> TextIO:
+    if zstandard is None:
+        raise Exception("zstandard is required for .zst files")
+    return zstandard.open(file_name, mode, **kwargs)
+
+
+COMPRESSED_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+    '.lzma': lzma.open,
+    '.zst': _zstd_open,
+}
+
+
+def open_text(file_name: str, mode: str = 'r', buffering: int = -1,
+              encoding: Optional[str] = None, errors: Optional[str] = None) -> TextIO:
+    """
+    Open a text file for reading or writing, compressed or not. Files ending in
+    .gz, .bz2, .xz, .lzma or .zst are (de)compressed on the fly while streaming,
+    anything else is opened with the builtin open.
+    
+    Args: file_name(str): The name of the file.
+    mode(str): 'r', 'w' or 'a'.
+    buffering(int): The buffer size in bytes, see open. For compressed files a
+    buffer of this size is placed in front of the (de)compressor, so it collects
+    uncompressed data. The default -1 keeps the default buffering.
+    encoding(str, optional): The text encoding, see open. Defaults to the locale encoding.
+    errors(str, optional): How encoding errors are handled, see open.
+    
+    Returns: TextIO: The open text file.
+    """
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(file_name)[1])
+    if opener is None:
+        return open(file_name, mode, buffering=buffering, encoding=encoding, errors=errors)
+    if buffering <= 1:
+        return opener(file_name, mode + 't', encoding=encoding, errors=errors)
+
+    binary_file = opener(file_name, mode + 'b')
+    buffered_type = io.BufferedReader if mode == 'r' else io.BufferedWriter
+    return io.TextIOWrapper(buffered_type(binary_file, buffering), encoding=encoding, errors=errors)
+
+
+def _output_file_name(file_name: str, prefix: str, compression: Optional[str] = None) -> str:
+    """
+    The {prefix}_{file_name} output next to the input. The compression suffix of
+    a compressed input is dropped, and compression (e.g. 'gz') adds its own.
+    Raises Exception("Invalid input") for a compression without an entry in COMPRESSED_OPENERS.
+    """
+    if compression is not None and f".{compression}" not in COMPRESSED_OPENERS:
+        raise Exception("Invalid input")
+
+    base_name = os.path.basename(file_name)
+    root, extension = os.path.splitext(base_name)
+    if extension in COMPRESSED_OPENERS:
+        base_name = root
+    if compression is not None:
+        base_name = f"{base_name}.{compression}"
+    return os.path.join(os.path.dirname(file_name), f"{prefix}_{base_name}")
 
 
 def find_max_in_lines(file_name: str) -> List[int]:
@@ -11,12 +113,14 @@ def find_max_in_lines(file_name: str) -> List[int]:
     Args: file_name(str): The name of the input text file where 
     each line contains multiple integers.
     
+    The file may be compressed, see open_text.
+    
     return: list(int): A list of integers, where each element 
     corresponds to the maximum integer from each line in the file.
     """
     try:
     
-        with open(file_name, 'r') as file_handle:
+        with open_text(file_name, 'r') as file_handle:
             max_vector = []
 
             for line in file_handle:
@@ -34,13 +138,175 @@ def find_max_in_lines(file_name: str) -> List[int]:
 
 
 
-def anagram_finder(file_name: str) -> None:
+def iter_max_in_lines(file_name: str) -> Iterator[int]:
+    """
+    Generator version of find_max_in_lines that yields each line maximum as
+    soon as the line is read, without keeping the result list.
+    
+    Args: file_name(str): The name of the input text file where 
+    each line contains multiple integers.
+    
+    return: Iterator[int]: The maximum integer of each non-empty line.
+    """
+    try:
+        file_handle = open_text(file_name, 'r')
+    except FileNotFoundError:
+        raise Exception("File Not Found")
+
+    with file_handle:
+        for line in file_handle:
+            if line != '\n':
+                yield max(map(int, line.split(',')))
+
+
+def _max_in_block(block: bytes) -> List[int]:
+    """
+    Line maxima of a block of complete lines. With NumPy the whole block is
+    parsed in one np.fromstring call and reduced per line, otherwise every
+    line is split and converted with int(), which accepts bytes directly.
+    """
+    lines = [line for line in block.split(b'\n') if line not in (b'', b'\r')]
+    if not lines:
+        return []
+
+    if np is not None:
+        counts = [line.count(b',') + 1 for line in lines]
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                values = np.fromstring(b','.join(lines), dtype=np.int64, sep=',')
+        except (ValueError, DeprecationWarning):
+            values = None
+
+        # Fall back to int() for anything NumPy cannot parse exactly, including
+        # blank fields that it reads as 0 and values clipped to the int64 range,
+        # so that they raise the same ValueError as in find_max_in_lines.
+        if values is not None and values.size == sum(counts) and not (
+                any(BLANK_FIELD.search(line) for line in lines)
+                or (values == INT64_MAX).any() or (values == INT64_MIN).any()):
+            offsets = np.cumsum([0] + counts[:-1])
+            return np.maximum.reduceat(values, offsets).tolist()
+
+    return [max(map(int, line.split(b','))) for line in lines]
+
+
+def _newline_aligned_ranges(file_name: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into (start, end) byte ranges of about chunk_size bytes that
+    each begin at the start of a line and end just after a newline (or at EOF).
+    """
+    file_size = os.path.getsize(file_name)
+    ranges = []
+
+    with open(file_name, 'rb') as file_handle:
+        start = 0
+        while start < file_size:
+            file_handle.seek(min(start + chunk_size, file_size))
+            file_handle.readline()
+            end = min(file_handle.tell(), file_size)
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def _max_in_range(file_name: str, start: int, end: int, chunk_size: int) -> List[int]:
+    """
+    Line maxima of the newline-aligned byte range [start, end) of a file, read
+    through a memory map one newline-aligned block at a time.
+    """
+    max_vector = []
+
+    with open(file_name, 'rb') as file_handle, \
+            mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        while start < end:
+            block_end = buffer.find(b'\n', min(start + chunk_size, end) - 1, end)
+            block_end = end if block_end == -1 else block_end + 1
+            max_vector.extend(_max_in_block(buffer[start:block_end]))
+            start = block_end
+
+    return max_vector
+
+
+def find_max_in_lines_mmap(file_name: str, chunk_size: int = 1 << 24) -> List[int]:
+    """
+    Same result as find_max_in_lines, but the file is memory-mapped and parsed
+    in newline-aligned blocks of about chunk_size bytes. When NumPy is
+    installed each block is parsed without creating a Python int per value.
+    
+    Args: file_name(str): The name of the input text file where 
+    each line contains multiple integers.
+    chunk_size(int): The approximate number of bytes parsed per block.
+    
+    return: list(int): The maximum integer of each non-empty line.
+    """
+    if not os.path.exists(file_name):
+        raise Exception("File Not Found")
+
+    if os.path.getsize(file_name) == 0:
+        return []
+
+    return _max_in_range(file_name, 0, os.path.getsize(file_name), chunk_size)
+
+
+def find_max_in_lines_parallel(file_name: str, workers: Optional[int] = None,
+                               chunk_size: int = 1 << 26) -> List[int]:
+    """
+    Same result as find_max_in_lines, computed by a process pool. The file is
+    split at newline boundaries into ranges of about chunk_size bytes, each
+    range is parsed like find_max_in_lines_mmap in a worker, and the maxima
+    are concatenated in file order.
+    
+    Args: file_name(str): The name of the input text file where 
+    each line contains multiple integers.
+    workers(int, optional): The number of worker processes. Defaults to the CPU count.
+    chunk_size(int): The approximate number of bytes per worker task.
+    
+    return: list(int): The maximum integer of each non-empty line.
+    """
+    if not os.path.exists(file_name):
+        raise Exception("File Not Found")
+
+    ranges = _newline_aligned_ranges(file_name, chunk_size)
+    if len(ranges) <= 1:
+        return find_max_in_lines_mmap(file_name)
+
+    max_vector = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_max_in_range, file_name, start, end, chunk_size)
+                   for start, end in ranges]
+        for future in futures:
+            max_vector.extend(future.result())
+
+    return max_vector
+
+
+def _anagram_line(line: str) -> str:
+    """
+    The anagram_finder output for one input line (without the newline).
+    Words are counted once with a Counter and grouped by their sorted letters
+    in a dict, so a line costs linear time in its number of words.
+    """
+    words = line.lower().strip().translate(PUNCTUATION_TABLE).split()
+    word_counts = Counter(words)
+
+    anagrams_dict = {}
+    for word in words:
+        if word_counts[word] == 1:
+            anagrams_dict.setdefault(''.join(sorted(word)), []).append(word)
+
+    result = ' '.join([','.join(v) for v in anagrams_dict.values() if len(v) > 1])
+    return result or '-'
+
+
+def anagram_finder(file_name: str, output_compression: Optional[str] = None) -> None:
     """
     Implement a function that finds anagram pairs from the input file and write the 
     result to output file.
     
     Args: file_name(str): The name of the input text file that 
-    contains sentences to check for anagrams.
+    contains sentences to check for anagrams. It may be compressed, see open_text.
+    output_compression(str, optional): Compress the output, e.g. 'gz', 'bz2' or 'xz'.
     
     Return: None The function does not return anything but will 
     create a new file with the name anagrams_{file_name}
@@ -48,55 +314,94 @@ def anagram_finder(file_name: str) -> None:
     """
     try:
         # Create the output file path in the same directory as the input file
-        output_file_name = os.path.join(os.path.dirname(file_name), f"anagrams_{os.path.basename(file_name)}")
+        output_file_name = _output_file_name(file_name, 'anagrams', output_compression)
         
-        with open(file_name, 'r') as input_file:
-            with open(output_file_name, 'w') as output_file:
+        with open_text(file_name, 'r', encoding=TEXT_ENCODING, errors=TEXT_ERRORS) as input_file:
+            with open_text(output_file_name, 'w', encoding=TEXT_ENCODING) as output_file:
                 for line in input_file:
-                    line = line.lower().strip()
-                    cleaned_line = ''.join([char for char in line if char not in string.punctuation])
-                    words = cleaned_line.split()
-
-                    no_duplicate_words = [word for word in words if words.count(word) == 1]
-                    sorted_words = [''.join(sorted(word)) for word in no_duplicate_words]
-
-                    anagrams_dict = {}
-                    for i, sorted_word in enumerate(sorted_words):
-                        if sorted_words.count(sorted_word) > 1:
-                            if sorted_word in anagrams_dict:
-                                anagrams_dict[sorted_word].append(no_duplicate_words[i])
-                            else:
-                                anagrams_dict[sorted_word] = [no_duplicate_words[i]]
-
-                    if not anagrams_dict:
-                        output_file.write('-\n')
-                    else:
-                        result = ' '.join([','.join(v) for v in anagrams_dict.values()])
-                        output_file.write(result + '\n')
+                    output_file.write(_anagram_line(line) + '\n')
                 
     except FileNotFoundError:
         raise Exception("File Not Found")
 
 
-def log_file_categorizer(file_name: str) -> None:
+def _anagram_range(file_name: str, start: int, end: int) -> str:
     """
-    Implement a function to categorize the log entries based on the event types.
+    The anagram_finder output for the newline-aligned byte range [start, end)
+    of a file. The bytes are decoded through a TextIOWrapper so newlines and
+    the encoding are handled exactly like the input file of anagram_finder.
+    """
+    with open(file_name, 'rb') as file_handle:
+        file_handle.seek(start)
+        data = file_handle.read(end - start)
+
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding=TEXT_ENCODING, errors=TEXT_ERRORS)
+    return ''.join([_anagram_line(line) + '\n' for line in lines])
+
+
+def anagram_finder_parallel(file_name: str, workers: Optional[int] = None,
+                            chunk_size: int = 1 << 22) -> None:
+    """
+    Same output as anagram_finder, computed by a process pool for large files.
+    
+    The input is split into line-aligned byte ranges of about chunk_size bytes.
+    Each range is processed in a worker, and the results are written to
+    anagrams_{file_name} in the original line order with large buffered
+    writes. Only a bounded number of ranges is in flight at a time.
     
     Args: file_name(str): The name of the input text file that 
     contains sentences to check for anagrams.
+    workers(int, optional): The number of worker processes. Defaults to the CPU count.
+    chunk_size(int): The approximate number of bytes per worker task.
+    
+    Return: None The function does not return anything but will 
+    create a new file with the name anagrams_{file_name}
+    """
+    if not os.path.exists(file_name):
+        raise Exception("File Not Found")
+
+    output_file_name = os.path.join(os.path.dirname(file_name), f"anagrams_{os.path.basename(file_name)}")
+    ranges = _newline_aligned_ranges(file_name, chunk_size)
+
+    with open(output_file_name, 'w', buffering=WRITE_BUFFER_SIZE, encoding=TEXT_ENCODING) as output_file:
+        if len(ranges) <= 1:
+            for start, end in ranges:
+                output_file.write(_anagram_range(file_name, start, end))
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            max_pending = 2 * (workers or os.cpu_count() or 1)
+            pending = deque()
+
+            for start, end in ranges:
+                pending.append(executor.submit(_anagram_range, file_name, start, end))
+                if len(pending) >= max_pending:
+                    output_file.write(pending.popleft().result())
+
+            while pending:
+                output_file.write(pending.popleft().result())
+
+
+def log_file_categorizer(file_name: str, output_compression: Optional[str] = None) -> None:
+    """
+    Implement a function to categorize the log entries based on the event types.
+    
+    Args: file_name(str): The name of the input text file that 
+    contains sentences to check for anagrams. It may be compressed, see open_text.
+    output_compression(str, optional): Compress the outputs, e.g. 'gz', 'bz2' or 'xz'.
     
     Returns: None The function does not return anything but will 
     create a new file with the name anagrams_{file_name}
     """
     try:
-        with open(file_name, 'r') as input_file:
-            error_file_name = os.path.join(os.path.dirname(file_name), f"error_{os.path.basename(file_name)}")
-            info_file_name = os.path.join(os.path.dirname(file_name), f"info_{os.path.basename(file_name)}")
-            warning_file_name = os.path.join(os.path.dirname(file_name), f"warning_{os.path.basename(file_name)}")
+        with open_text(file_name, 'r') as input_file:
+            error_file_name = _output_file_name(file_name, 'error', output_compression)
+            info_file_name = _output_file_name(file_name, 'info', output_compression)
+            warning_file_name = _output_file_name(file_name, 'warning', output_compression)
 
-            with open(error_file_name, 'w') as error_file, \
-                 open(info_file_name, 'w') as info_file, \
-                 open(warning_file_name, 'w') as warning_file:
+            with open_text(error_file_name, 'w') as error_file, \
+                 open_text(info_file_name, 'w') as info_file, \
+                 open_text(warning_file_name, 'w') as warning_file:
 
                 for line in input_file:
                     line = line.strip()  # Remove leading/trailing whitespace
@@ -114,4 +419,430 @@ def log_file_categorizer(file_name: str) -> None:
 
     except FileNotFoundError:
         raise Exception("File Not Found")
-    
\ No newline at end of file
+
+
+def _split_log_line(line: str) -> Tuple[Optional[str], str]:
+    """
+    The timestamp and level of a stripped, non-empty log line. The level is the
+    leading token without the punctuation around it, so "ERROR:", "[ERROR]"
+    and "<ERROR>" all give "ERROR". A timestamp such as "2024-05-01 12:30:05"
+    or "[2024-05-01T12:30]" may come before or right after the level.
+    """
+    timestamp = None
+    if line[0].isdigit() or line[0] == '[':
+        match = LOG_TIMESTAMP.match(line)
+        if match and match.end() < len(line):
+            timestamp = match.group(1)
+            line = line[match.end():]
+
+    parts = line.split(None, 1)
+    if timestamp is None and len(parts) > 1:
+        match = LOG_TIMESTAMP.match(parts[1])
+        if match:
+            timestamp = match.group(1)
+
+    return timestamp, parts[0].strip(string.punctuation)
+
+
+class LogStatistics:
+    """
+    Per-level line counts, first and last timestamps and time-bucket histograms,
+    collected while a log is categorized. Lines without a timestamp, or with
+    one that is not a real date and time such as 2024-13-45, are counted but
+    not bucketed.
+    """
+
+    def __init__(self, bucket_seconds: int = 60):
+        if type(bucket_seconds) is not int or bucket_seconds <= 0:
+            raise Exception("Invalid input")
+        self.bucket_seconds = bucket_seconds
+        self.levels = {}
+
+    def add(self, level: str, timestamp: Optional[str]) -> None:
+        stats = self.levels.get(level)
+        if stats is None:
+            stats = self.levels[level] = {'count': 0, 'first': None, 'last': None, 'histogram': Counter()}
+
+        stats['count'] += 1
+        if timestamp is None:
+            return
+
+        timestamp = timestamp.replace('T', ' ').replace(',', '.')
+        bucket = self._bucket(timestamp)
+        if bucket is None:
+            return
+
+        if stats['first'] is None or timestamp < stats['first']:
+            stats['first'] = timestamp
+        if stats['last'] is None or timestamp > stats['last']:
+            stats['last'] = timestamp
+        stats['histogram'][bucket] += 1
+
+    def _bucket(self, timestamp: str) -> Optional[str]:
+        """
+        The start of the time bucket of a normalized 'YYYY-MM-DD HH:MM[:SS]' timestamp,
+        or None if it is not a valid date and time.
+        """
+        second = int(timestamp[17:19]) if len(timestamp) >= 19 else 0
+        try:
+            seconds = _minute_seconds(timestamp[:16]) + second
+        except ValueError:
+            return None
+        if second > 59:
+            return None
+
+        if self.bucket_seconds == 60:
+            return timestamp[:16] + ':00'
+
+        seconds -= seconds % self.bucket_seconds
+        return (EPOCH + timedelta(seconds=seconds)).strftime('%Y-%m-%d %H:%M:%S')
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """
+        Returns: Dict[str, Dict]: For every level its count, first and last
+        timestamp and a histogram of bucket start -> count in time order.
+        """
+        return {level: {'count': stats['count'], 'first': stats['first'], 'last': stats['last'],
+                        'histogram': dict(sorted(stats['histogram'].items()))}
+                for level, stats in self.levels.items()}
+
+    def write(self, file_name: str) -> None:
+        """
+        Write the summary as JSON, or as CSV rows of level, bucket and count when
+        file_name ends in .csv. The CSV has one "total" row per level.
+        """
+        summary = self.to_dict()
+
+        if not file_name.endswith('.csv'):
+            with open(file_name, 'w') as summary_file:
+                json.dump({'bucket_seconds': self.bucket_seconds, 'levels': summary}, summary_file, indent=2)
+            return
+
+        with open(file_name, 'w', newline='') as summary_file:
+            writer = csv.writer(summary_file)
+            writer.writerow(['level', 'bucket', 'count'])
+            for level, stats in summary.items():
+                writer.writerow([level, 'total', stats['count']])
+                for bucket, count in stats['histogram'].items():
+                    writer.writerow([level, bucket, count])
+
+
+@lru_cache(maxsize=1 << 16)
+def _minute_seconds(minute: str) -> int:
+    return int((datetime.fromisoformat(minute) - EPOCH).total_seconds())
+
+
+def _write_categorized(lines: Iterable[str], outputs: Dict[str, TextIO], counts: Dict[str, int],
+                       statistics: Optional[LogStatistics] = None) -> None:
+    """
+    Write every line with a known level to its output and count it.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        timestamp, level = _split_log_line(line)
+        output_file = outputs.get(level)
+        if output_file is not None:
+            output_file.write(line + '\n')
+            counts[level] += 1
+            if statistics is not None:
+                statistics.add(level, timestamp)
+
+
+def categorize_log_file(file_name: str, levels: Optional[Dict[str, str]] = None,
+                        buffer_size: int = WRITE_BUFFER_SIZE,
+                        output_compression: Optional[str] = None,
+                        statistics: Optional[LogStatistics] = None) -> Dict[str, int]:
+    """
+    A single-pass, configurable version of log_file_categorizer.
+    
+    Only the leading token of each line is inspected (after a leading
+    timestamp, if any), instead of stripping the punctuation of the whole line.
+    Every level in levels gets its own output file {prefix}_{file_name} with a
+    large write buffer. Blank lines and lines with an unknown level are skipped.
+    
+    Args: file_name(str): The name of the input log file.
+    levels(Dict[str, str], optional): Maps a level such as "ERROR", "DEBUG" or
+    "CRITICAL" to the prefix of its output file. Defaults to DEFAULT_LOG_LEVELS.
+    buffer_size(int): The write buffer size of every output file in bytes.
+    output_compression(str, optional): Compress the outputs, e.g. 'gz', 'bz2' or 'xz'.
+    The input may be compressed too, see open_text.
+    statistics(LogStatistics, optional): Also collect timestamps and histograms
+    of the categorized lines in the same pass.
+    
+    Returns: Dict[str, int]: The number of lines written for every level.
+    """
+    if levels is None:
+        levels = DEFAULT_LOG_LEVELS
+
+    if not os.path.exists(file_name):
+        raise Exception("File Not Found")
+
+    counts = dict.fromkeys(levels, 0)
+
+    with ExitStack() as stack:
+        input_file = stack.enter_context(open_text(file_name, 'r'))
+        outputs = {level: stack.enter_context(open_text(_output_file_name(file_name, prefix, output_compression),
+                                                        'w', buffering=buffer_size))
+                   for level, prefix in levels.items()}
+
+        _write_categorized(input_file, outputs, counts, statistics)
+
+    return counts
+
+
+def log_file_statistics(file_name: str, summary_file: Optional[str] = None,
+                        levels: Optional[Dict[str, str]] = None, bucket_seconds: int = 60,
+                        output_compression: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Categorize a log like categorize_log_file and summarize it in the same pass.
+    
+    Args: file_name(str): The name of the input log file.
+    summary_file(str, optional): Also write the summary there, as CSV when the
+    name ends in .csv and as JSON otherwise.
+    levels(Dict[str, str], optional): Maps a level to the prefix of its output
+    file. Defaults to DEFAULT_LOG_LEVELS.
+    bucket_seconds(int): The width of the histogram buckets in seconds.
+    output_compression(str, optional): Compress the outputs, e.g. 'gz', 'bz2' or 'xz'.
+    
+    Returns: Dict[str, Dict]: For every level seen its count, first and last
+    timestamp and a histogram of bucket start -> count.
+    """
+    statistics = LogStatistics(bucket_seconds)
+    categorize_log_file(file_name, levels, output_compression=output_compression, statistics=statistics)
+
+    if summary_file is not None:
+        statistics.write(summary_file)
+    return statistics.to_dict()
+
+
+def _checkpoint_file_name(file_name: str) -> str:
+    return os.path.join(os.path.dirname(file_name), f".{os.path.basename(file_name)}.checkpoint")
+
+
+def file_fingerprint(file_handle, offset: int) -> str:
+    """
+    Hash of the first block of a file and of the block just before offset.
+    If these still match, the data before offset is assumed unchanged and only
+    data after it has to be read. A file truncated and rewritten past the
+    offset on the same inode changes it.
+    """
+    digest = hashlib.sha1()
+    file_handle.seek(0)
+    digest.update(file_handle.read(min(FINGERPRINT_SIZE, offset)))
+    file_handle.seek(max(offset - FINGERPRINT_SIZE, 0))
+    digest.update(file_handle.read(min(FINGERPRINT_SIZE, offset)))
+    return digest.hexdigest()
+
+
+def _read_checkpoint(checkpoint_file: str) -> dict:
+    """
+    The saved checkpoint, or an empty one if it is missing, truncated or corrupt,
+    in which case the log is categorized from the start again.
+    """
+    try:
+        with open(checkpoint_file, 'r') as checkpoint_handle:
+            checkpoint = json.load(checkpoint_handle)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(checkpoint, dict) or type(checkpoint.get('offset', 0)) is not int:
+        return {}
+    return checkpoint
+
+
+def categorize_log_file_incremental(file_name: str, levels: Optional[Dict[str, str]] = None,
+                                    checkpoint_file: Optional[str] = None, encoding: str = 'utf-8',
+                                    buffer_size: int = WRITE_BUFFER_SIZE) -> Dict[str, int]:
+    """
+    Categorize only the lines appended to a log since the previous run.
+    
+    The byte offset after the last complete line, the inode of the log and a
+    fingerprint of the data before the offset are kept in a checkpoint file.
+    The new lines are always appended to the {prefix}_{file_name} outputs.
+    When the log was truncated or rewritten, or the checkpoint cannot be read,
+    it is read from the start again. When it was rotated (new inode), the rest
+    of the old log is categorized first if it is still in the same directory,
+    then the new log from the start. An unterminated last line is left for
+    the next run.
+    
+    Args: file_name(str): The name of the input log file.
+    levels(Dict[str, str], optional): Maps a level to the prefix of its output
+    file. Defaults to DEFAULT_LOG_LEVELS.
+    checkpoint_file(str, optional): Where the checkpoint is stored. Defaults to
+    .{file_name}.checkpoint next to the log.
+    encoding(str): The encoding of the log.
+    buffer_size(int): The write buffer size of every output file in bytes.
+    
+    Returns: Dict[str, int]: The number of new lines written for every level.
+    """
+    try:
+        input_file = open(file_name, 'rb')
+    except FileNotFoundError:
+        raise Exception("File Not Found")
+
+    return _categorize_incremental(input_file, file_name, levels, checkpoint_file, encoding, buffer_size)
+
+
+def _open_rotated_log(file_name: str, checkpoint: dict):
+    """
+    The log the checkpoint was taken on, if it was rotated away from file_name
+    but is still in the same directory with the checkpointed data unchanged.
+    """
+    inode = checkpoint.get('inode')
+    offset = checkpoint.get('offset', 0)
+    directory = os.path.dirname(file_name) or '.'
+
+    try:
+        with os.scandir(directory) as entries:
+            paths = [entry.path for entry in entries
+                     if entry.inode() == inode and entry.is_file() and entry.name != os.path.basename(file_name)]
+    except OSError:
+        return None
+
+    for path in paths:
+        try:
+            old_file = open(path, 'rb')
+        except OSError:
+            continue
+        stat = os.fstat(old_file.fileno())
+        if stat.st_ino == inode and 0 <= offset <= stat.st_size \
+                and checkpoint.get('fingerprint') == file_fingerprint(old_file, offset):
+            return old_file
+        old_file.close()
+    return None
+
+
+def _categorize_range(input_file, offset: int, size: int, outputs: Dict[str, TextIO],
+                      counts: Dict[str, int], encoding: str, final: bool) -> int:
+    """
+    Categorize the complete lines between offset and size and return the
+    offset after the last of them. With final set an unterminated last line
+    is categorized too, as no more data will be appended to it.
+    """
+    input_file.seek(offset)
+    remaining = size - offset
+    pending = b''
+
+    while remaining > 0:
+        block = input_file.read(min(READ_BLOCK_SIZE, remaining))
+        if not block:
+            break
+        remaining -= len(block)
+
+        block = pending + block
+        end = block.rfind(b'\n') + 1
+        pending = block[end:]
+        if end:
+            _write_categorized(block[:end].decode(encoding).split('\n'), outputs, counts)
+            offset += end
+
+    if final and pending:
+        _write_categorized([pending.decode(encoding)], outputs, counts)
+        offset += len(pending)
+    return offset
+
+
+def _categorize_incremental(input_file, file_name: str, levels: Optional[Dict[str, str]],
+                            checkpoint_file: Optional[str], encoding: str, buffer_size: int) -> Dict[str, int]:
+    if levels is None:
+        levels = DEFAULT_LOG_LEVELS
+    if checkpoint_file is None:
+        checkpoint_file = _checkpoint_file_name(file_name)
+
+    checkpoint = _read_checkpoint(checkpoint_file)
+    counts = dict.fromkeys(levels, 0)
+
+    with input_file, ExitStack() as stack:
+        stat = os.fstat(input_file.fileno())
+        offset = checkpoint.get('offset', 0)
+        old_file = None
+
+        if checkpoint.get('inode') == stat.st_ino:
+            # Truncated or rewritten in place: the old lines are gone, start over
+            if not (0 <= offset <= stat.st_size
+                    and checkpoint.get('fingerprint') == file_fingerprint(input_file, offset)):
+                offset = 0
+            elif offset == stat.st_size:
+                return counts
+        else:
+            # Rotated: finish the old log first if it can still be found
+            if 'inode' in checkpoint:
+                old_file = _open_rotated_log(file_name, checkpoint)
+            if old_file is not None:
+                stack.enter_context(old_file)
+            offset = 0
+
+        # The outputs are only ever appended to, so lines categorized before a
+        # rotation, truncation or rewrite are kept.
+        outputs = {level: stack.enter_context(open(_output_file_name(file_name, prefix), 'a',
+                                                   buffering=buffer_size))
+                   for level, prefix in levels.items()}
+
+        if old_file is not None:
+            _categorize_range(old_file, checkpoint['offset'], os.fstat(old_file.fileno()).st_size,
+                              outputs, counts, encoding, final=True)
+        offset = _categorize_range(input_file, offset, stat.st_size, outputs, counts, encoding, final=False)
+        fingerprint = file_fingerprint(input_file, offset)
+
+    # The checkpoint is only moved once the outputs are closed, so an
+    # interrupted run repeats lines rather than losing them.
+    temporary_file = checkpoint_file + '.tmp'
+    with open(temporary_file, 'w') as checkpoint_handle:
+        json.dump({'inode': stat.st_ino, 'offset': offset, 'fingerprint': fingerprint}, checkpoint_handle)
+    os.replace(temporary_file, checkpoint_file)
+
+    return counts
+
+
+def follow_log_file(file_name: str, levels: Optional[Dict[str, str]] = None,
+                    poll_interval: float = 1.0, max_polls: Optional[int] = None,
+                    checkpoint_file: Optional[str] = None, encoding: str = 'utf-8') -> Dict[str, int]:
+    """
+    Categorize a live log like tail -f, by polling categorize_log_file_incremental.
+    
+    New complete lines reach the outputs at most poll_interval seconds after
+    they are written. The log may not exist yet, or may disappear during
+    rotation, in which case polling simply continues. A rotated, truncated or
+    rewritten log is read from the start, see categorize_log_file_incremental.
+    
+    Args: file_name(str): The name of the input log file.
+    levels(Dict[str, str], optional): Maps a level to the prefix of its output
+    file. Defaults to DEFAULT_LOG_LEVELS.
+    poll_interval(float): The number of seconds between polls.
+    max_polls(int, optional): Stop after this many polls. Defaults to polling
+    until KeyboardInterrupt.
+    checkpoint_file(str, optional): Where the checkpoint is stored.
+    encoding(str): The encoding of the log.
+    
+    Returns: Dict[str, int]: The number of lines written for every level while following.
+    """
+    if levels is None:
+        levels = DEFAULT_LOG_LEVELS
+
+    totals = dict.fromkeys(levels, 0)
+    polls = 0
+
+    try:
+        while max_polls is None or polls < max_polls:
+            if polls:
+                time.sleep(poll_interval)
+            polls += 1
+
+            # Opened here rather than checked with os.path.exists, so a log
+            # rotated away between the check and the read cannot stop the loop
+            try:
+                input_file = open(file_name, 'rb')
+            except FileNotFoundError:
+                continue
+
+            counts = _categorize_incremental(input_file, file_name, levels, checkpoint_file, encoding,
+                                             WRITE_BUFFER_SIZE)
+            for level, count in counts.items():
+                totals[level] += count
+    except KeyboardInterrupt:
+        pass
+
+    return totals
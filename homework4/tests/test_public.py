@@ -1,5 +1,14 @@
+import bz2
+import gzip
+import json
 import os
+import shutil
+import tempfile
+
+import lab4
+from anagram_index import AnagramIndex
 from lab4 import find_max_in_lines, anagram_finder, log_file_categorizer
+from lab4 import iter_max_in_lines, find_max_in_lines_mmap, find_max_in_lines_parallel
 
 class Path:
     CURRENT_WORKING_DIR = os.getcwd()
@@ -118,8 +127,277 @@ def log_file_categorizer(file_name: str, error_file: str, info_file: str, warnin
         wf.write("\n".join(warning_logs))
 
 
+def validate_max_in_lines_modes():
+    """
+    Check the streaming, memory-mapped and parallel line maxima against the expected values.
+    """
+    expected = {
+        "numbers1.txt": [7, 9, 4],
+        "numbers2.txt": [5, 100, 60],
+        "numbers3.txt": [10, 30, -1],
+        "numbers4.txt": [],
+        "numbers6.txt": [4, 23, 5, 89],
+    }
+
+    for name, maxima in expected.items():
+        file_name = os.path.join(Path.MAX_IN_LINES_PATH, name)
+        assert list(iter_max_in_lines(file_name)) == maxima, f"iter_max_in_lines failed for {name}"
+        assert find_max_in_lines_mmap(file_name, chunk_size=4) == maxima, f"find_max_in_lines_mmap failed for {name}"
+        assert find_max_in_lines_parallel(file_name, workers=2, chunk_size=4) == maxima, \
+            f"find_max_in_lines_parallel failed for {name}"
+
+    # Blank and whitespace-only fields raise ValueError in every mode, as int() does
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "blank_fields.txt")
+        for content in ("-5, ,-3\n", "-7\n\t\n", "-1,-2\n-3, \n"):
+            with open(file_name, "w") as file_handle:
+                file_handle.write(content)
+            for finder in (lambda name: list(iter_max_in_lines(name)), find_max_in_lines_mmap,
+                           lambda name: find_max_in_lines_parallel(name, workers=2, chunk_size=4)):
+                try:
+                    finder(file_name)
+                except ValueError:
+                    pass
+                else:
+                    assert False, f"{content!r} did not raise ValueError"
+
+
+def validate_anagram_finder_output():
+    """
+    Run the sequential and parallel anagram finders on copies of the sample files
+    and compare with the expected outputs byte for byte.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("sample_file1.txt", "sample_file2.txt", "sample_file4.txt"):
+            shutil.copy(os.path.join(Path.ANAGRAMS_PATH, name), directory)
+            with open(os.path.join(Path.ANAGRAMS_PATH, f"anagrams_{name}"), "rb") as expected_file:
+                expected = expected_file.read()
+
+            for finder in (lab4.anagram_finder, lambda file_name: lab4.anagram_finder_parallel(file_name, 2, 16)):
+                finder(os.path.join(directory, name))
+                with open(os.path.join(directory, f"anagrams_{name}"), "rb") as result:
+                    assert result.read() == expected, f"anagram_finder failed for {name}"
+
+        # Undecodable bytes are replaced the same way by both finders and the index
+        invalid_file = os.path.join(directory, "invalid.txt")
+        with open(invalid_file, "wb") as file_handle:
+            file_handle.write(b"caf\xe9 listen silent\n\xff\xfe tac cat\n" * 3)
+
+        outputs = []
+        for finder in (lab4.anagram_finder, lambda file_name: lab4.anagram_finder_parallel(file_name, 2, 16)):
+            finder(invalid_file)
+            with open(os.path.join(directory, "anagrams_invalid.txt"), "rb") as result:
+                outputs.append(result.read())
+        assert outputs[0] == outputs[1] == b"listen,silent\ntac,cat\n" * 3, f"anagram_finder failed for invalid bytes: {outputs}"
+
+        with AnagramIndex(os.path.join(directory, "anagrams.db")) as index:
+            assert index.update(invalid_file) == 6
+            assert index.anagrams("caf\ufffd") == []
+
+
+def validate_anagram_index():
+    """
+    Build an on-disk anagram index, reopen it, and update it after an append and a rewrite.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        words_file = os.path.join(directory, "words.txt")
+        index_file = os.path.join(directory, "anagrams.db")
+
+        with open(words_file, "w") as file_handle:
+            file_handle.write("Listen to the silent night\nThe cat acts\n")
+
+        with AnagramIndex(index_file) as index:
+            assert index.update(words_file) == 2
+            assert index.anagrams("listen") == ["silent"]
+
+        with open(words_file, "a") as file_handle:
+            file_handle.write("enlist tac\n")
+
+        with AnagramIndex(index_file) as index:
+            assert index.update(words_file) == 1, "Only the appended line should be read"
+            assert index.update(words_file) == 0, "An unchanged file should be skipped"
+            assert list(index.groups()) == [["cat", "tac"], ["enlist", "listen", "silent"]]
+
+            with open(words_file, "w") as file_handle:
+                file_handle.write("tinsel\n")
+            os.utime(words_file, ns=(0, 0))
+            index.update(words_file)
+            assert list(index.groups()) == []
+
+
+def validate_categorize_log_file():
+    """
+    Run categorize_log_file on copies of the sample logs and compare with the expected outputs,
+    then check custom levels and blank lines.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("log.txt", "server_log.txt", "empty_log.txt"):
+            shutil.copy(os.path.join(Path.LOG_FILES_PATH, name), directory)
+            lab4.categorize_log_file(os.path.join(directory, name))
+
+            for prefix in ("error", "info", "warning"):
+                with open(os.path.join(directory, f"{prefix}_{name}")) as result, \
+                        open(os.path.join(Path.LOG_FILES_PATH, f"{prefix}_{name}")) as expected:
+                    assert result.read() == expected.read(), f"categorize_log_file failed for {prefix}_{name}"
+
+        custom_log = os.path.join(directory, "custom_log.txt")
+        with open(custom_log, "w") as file_handle:
+            file_handle.write("DEBUG: cache warm\n\n[CRITICAL] disk failure\nERROR: timeout\n")
+
+        counts = lab4.categorize_log_file(custom_log, {"DEBUG": "debug", "CRITICAL": "critical"})
+        assert counts == {"DEBUG": 1, "CRITICAL": 1}, f"categorize_log_file failed for custom levels: {counts}"
+        with open(os.path.join(directory, "critical_custom_log.txt")) as result:
+            assert result.read() == "[CRITICAL] disk failure\n"
+
+
+def validate_incremental_log_categorizer():
+    """
+    Categorize a growing log incrementally and check only new complete lines are appended.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        log_file = os.path.join(directory, "app_log.txt")
+        with open(log_file, "w") as file_handle:
+            file_handle.write("ERROR: disk full\nINFO: started\nWARNING: slow")
+
+        counts = lab4.categorize_log_file_incremental(log_file)
+        assert counts == {"ERROR": 1, "INFO": 1, "WARNING": 0}, f"First incremental run failed: {counts}"
+
+        with open(log_file, "a") as file_handle:
+            file_handle.write(" disk\nERROR: timeout\n")
+
+        counts = lab4.follow_log_file(log_file, poll_interval=0, max_polls=2)
+        assert counts == {"ERROR": 1, "INFO": 0, "WARNING": 1}, f"Follow run failed: {counts}"
+
+        with open(os.path.join(directory, "error_app_log.txt")) as result:
+            assert result.read() == "ERROR: disk full\nERROR: timeout\n"
+        with open(os.path.join(directory, "warning_app_log.txt")) as result:
+            assert result.read() == "WARNING: slow disk\n"
+
+        # Truncated and regrown past the old offset on the same inode: read it
+        # from the start, still appending to the outputs
+        with open(log_file, "w") as file_handle:
+            file_handle.write("INFO: restarted after the log was cleared\nERROR: disk still full\n")
+        counts = lab4.categorize_log_file_incremental(log_file)
+        assert counts == {"ERROR": 1, "INFO": 1, "WARNING": 0}, f"Rewritten log run failed: {counts}"
+        with open(os.path.join(directory, "error_app_log.txt")) as result:
+            assert result.read() == "ERROR: disk full\nERROR: timeout\nERROR: disk still full\n"
+
+        # Rotated: the lines written to the old log before the rotation are not lost
+        with open(log_file, "a") as file_handle:
+            file_handle.write("ERROR: before rotation\nWARNING: unterminated")
+        os.rename(log_file, log_file + ".1")
+        with open(log_file, "w") as file_handle:
+            file_handle.write("ERROR: after rotation\n")
+        counts = lab4.categorize_log_file_incremental(log_file)
+        assert counts == {"ERROR": 2, "INFO": 0, "WARNING": 1}, f"Rotated log run failed: {counts}"
+        with open(os.path.join(directory, "error_app_log.txt")) as result:
+            assert result.read().endswith("ERROR: disk still full\nERROR: before rotation\nERROR: after rotation\n")
+        os.remove(log_file + ".1")
+
+        # A corrupt checkpoint also starts over instead of failing
+        with open(os.path.join(directory, ".app_log.txt.checkpoint"), "w") as file_handle:
+            file_handle.write('{"inode": ')
+        counts = lab4.follow_log_file(log_file, poll_interval=0, max_polls=1)
+        assert counts == {"ERROR": 1, "INFO": 0, "WARNING": 0}, f"Corrupt checkpoint run failed: {counts}"
+
+        os.remove(log_file)
+        counts = lab4.follow_log_file(log_file, poll_interval=0, max_polls=1)
+        assert counts == {"ERROR": 0, "INFO": 0, "WARNING": 0}, f"Missing log run failed: {counts}"
+
+
+def validate_compressed_files():
+    """
+    Read gzip-compressed inputs and write compressed outputs with the lab4 file processors.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        numbers_file = os.path.join(directory, "numbers1.txt.gz")
+        log_file = os.path.join(directory, "log.txt.gz")
+        for source, target in ((os.path.join(Path.MAX_IN_LINES_PATH, "numbers1.txt"), numbers_file),
+                               (os.path.join(Path.LOG_FILES_PATH, "log.txt"), log_file)):
+            with open(source, "rb") as plain, gzip.open(target, "wb") as compressed:
+                compressed.write(plain.read())
+
+        assert lab4.find_max_in_lines(numbers_file) == [7, 9, 4]
+
+        lab4.log_file_categorizer(log_file, output_compression="gz")
+        for prefix in ("error", "info", "warning"):
+            with gzip.open(os.path.join(directory, f"{prefix}_log.txt.gz"), "rt") as result, \
+                    open(os.path.join(Path.LOG_FILES_PATH, f"{prefix}_log.txt")) as expected:
+                assert result.read() == expected.read(), f"log_file_categorizer failed for {prefix}_log.txt.gz"
+
+        # The write buffer also applies to compressed outputs
+        lab4.categorize_log_file(log_file, buffer_size=1 << 16, output_compression="bz2")
+        with bz2.open(os.path.join(directory, "error_log.txt.bz2"), "rt") as result, \
+                open(os.path.join(Path.LOG_FILES_PATH, "error_log.txt")) as expected:
+            assert result.read() == expected.read(), "categorize_log_file failed for error_log.txt.bz2"
+
+        try:
+            lab4.log_file_categorizer(log_file, output_compression="gzip")
+        except Exception as e:
+            assert str(e) == "Invalid input", f"Unknown compression raised {e!r}"
+        else:
+            assert False, "log_file_categorizer accepted an unknown compression"
+        assert not os.path.exists(os.path.join(directory, "error_log.txt.gzip"))
+
+
+def validate_log_file_statistics():
+    """
+    Collect per-level counts, timestamps and minute histograms while categorizing a log.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        log_file = os.path.join(directory, "timed_log.txt")
+        summary_file = os.path.join(directory, "summary.json")
+        with open(log_file, "w") as file_handle:
+            file_handle.write("2024-05-01 12:00:05 ERROR disk full\n"
+                              "[2024-05-01 12:00:40] INFO started\n"
+                              "ERROR: 2024-05-01 12:01:10 timeout\n"
+                              "\n"
+                              "WARNING: no timestamp\n"
+                              "2024-13-45 10:00:00 WARNING impossible date\n")
+
+        summary = lab4.log_file_statistics(log_file, summary_file)
+        assert summary["ERROR"] == {
+            "count": 2,
+            "first": "2024-05-01 12:00:05",
+            "last": "2024-05-01 12:01:10",
+            "histogram": {"2024-05-01 12:00:00": 1, "2024-05-01 12:01:00": 1},
+        }, f"log_file_statistics failed for ERROR: {summary['ERROR']}"
+        assert summary["WARNING"] == {"count": 2, "first": None, "last": None, "histogram": {}}
+
+        with open(summary_file) as file_handle:
+            assert json.load(file_handle)["levels"] == summary
+        with open(os.path.join(directory, "info_timed_log.txt")) as result:
+            assert result.read() == "[2024-05-01 12:00:40] INFO started\n"
+
+        for bucket_seconds in (60, 30):
+            summary = lab4.log_file_statistics(log_file, bucket_seconds=bucket_seconds)
+            assert summary["WARNING"]["count"] == 2 and summary["WARNING"]["histogram"] == {}, \
+                f"Invalid timestamp was bucketed with bucket_seconds={bucket_seconds}: {summary['WARNING']}"
+
+
 # Example usage:
 if __name__ == "__main__":
+    validate_max_in_lines_modes()
+    print("Line maxima modes validated.")
+
+    validate_anagram_finder_output()
+    print("Anagram outputs validated.")
+
+    validate_anagram_index()
+    print("Anagram index validated.")
+
+    validate_categorize_log_file()
+    print("Log categorizer validated.")
+
+    validate_incremental_log_categorizer()
+    print("Incremental log categorizer validated.")
+
+    validate_compressed_files()
+    print("Compressed files validated.")
+
+    validate_log_file_statistics()
+    print("Log statistics validated.")
+
     # Example for find_max_in_lines
     try:
         max_numbers = find_max_in_lines(os.path.join(Path.MAX_IN_LINES_PATH, "numbers1.txt"))
@@ -0,0 +1,166 @@
+import csv
+import os
+import random
+import tempfile
+import time
+
+from columnar_cache import analyze_employee_data_cached
+from lab5 import AnalysisEngine, RejectReport, SalesAggregator, Schema, analyze_employee_data, analyze_sales_data
+
+
+def make_sales_file(filepath: str, row_count: int, extra_columns: int = 60, seed: int = 0) -> None:
+    """
+    Write a wide synthetic sales export: the four sales columns mixed in with
+    extra_columns filler columns.
+    """
+    rng = random.Random(seed)
+    filler = [f"Extra{i}" for i in range(extra_columns)]
+    header = filler[:extra_columns // 2] + ['ProductID', 'ProductCategory', 'SalesRegion', 'SaleAmount'] \
+        + filler[extra_columns // 2:]
+
+    with open(filepath, 'w', newline='') as file_handle:
+        writer = csv.writer(file_handle)
+        writer.writerow(header)
+        for i in range(row_count):
+            values = [f"P{i:07}", rng.choice(('Electronics', 'Clothing', 'Home')),
+                      rng.choice(('North', 'South', 'East', 'West')), f"{rng.uniform(1, 1000):.2f}"]
+            fillers = [str(rng.randint(0, 10 ** 6)) for _ in range(extra_columns)]
+            writer.writerow(fillers[:extra_columns // 2] + values + fillers[extra_columns // 2:])
+
+
+def make_employee_file(filepath: str, row_count: int, extra_columns: int = 20, seed: int = 0) -> None:
+    """
+    Write a synthetic employee export: the three columns analyze_employee_data
+    reads followed by extra_columns filler columns.
+    """
+    rng = random.Random(seed)
+    header = ['Gender', 'JobLevel', 'ProblemSolvingScore'] + [f"Extra{i}" for i in range(extra_columns)]
+
+    with open(filepath, 'w', newline='') as file_handle:
+        writer = csv.writer(file_handle)
+        writer.writerow(header)
+        for _ in range(row_count):
+            writer.writerow([rng.choice(('Male', 'Female')), rng.choice(('Entry Level', 'Mid Level', 'Senior')),
+                             rng.randint(0, 100)] + [f"{rng.uniform(0, 1000):.2f}" for _ in range(extra_columns)])
+
+
+def _time(label: str, row_count: int, function) -> float:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label}: {row_count:,} rows in {elapsed:.3f}s ({row_count / elapsed:,.0f} rows/s)")
+    return elapsed
+
+
+def benchmark_projected_reader(row_count: int = 200000, extra_columns: int = 60) -> None:
+    """
+    Compare feeding the sales report from csv.DictReader rows with the
+    column-projected csv.reader path used by AnalysisEngine.run.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "sales.csv")
+        make_sales_file(filepath, row_count, extra_columns)
+
+        def dict_reader():
+            engine = AnalysisEngine()
+            engine.register('sales', SalesAggregator())
+            with open(filepath, 'r') as file_handle:
+                engine.feed(csv.DictReader(file_handle))
+            return engine.results()
+
+        def projected_reader():
+            engine = AnalysisEngine()
+            engine.register('sales', SalesAggregator())
+            return engine.run(filepath)
+
+        baseline = _time("csv.DictReader", row_count, dict_reader)
+        projected = _time("projected csv.reader", row_count, projected_reader)
+        print(f"projected reader speedup: {baseline / projected:.2f}x")
+
+
+def benchmark_parallel_scaling(row_count: int = 1000000, extra_columns: int = 8, max_workers: int = None) -> None:
+    """
+    Time analyze_sales_data with 1 to max_workers worker processes (default:
+    the CPU count) and print the speedup over a single process.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "sales.csv")
+        make_sales_file(filepath, row_count, extra_columns)
+
+        sequential = analyze_sales_data(filepath)
+        baseline = None
+        for workers in range(1, max_workers + 1):
+            def parallel():
+                assert analyze_sales_data(filepath, workers) == sequential
+
+            elapsed = _time(f"analyze_sales_data, {workers} workers", row_count, parallel)
+            baseline = baseline or elapsed
+            print(f"speedup over 1 worker: {baseline / elapsed:.2f}x")
+
+
+def benchmark_columnar_cache(row_count: int = 500000, extra_columns: int = 20) -> None:
+    """
+    Compare analyze_employee_data on the CSV file with the columnar cache,
+    once when the cache is built and once when it is reused.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "employees.csv")
+        make_employee_file(filepath, row_count, extra_columns)
+
+        baseline = _time("analyze_employee_data", row_count, lambda: analyze_employee_data(filepath))
+        _time("columnar cache, first run", row_count, lambda: analyze_employee_data_cached(filepath))
+        cached = _time("columnar cache, later runs", row_count, lambda: analyze_employee_data_cached(filepath))
+        print(f"cached speedup: {baseline / cached:.2f}x, CSV {os.path.getsize(filepath) / 2 ** 20:.1f} MiB")
+
+
+def benchmark_schema_conversion(row_count: int = 10000000) -> None:
+    """
+    Compare converting the sales columns with a hand-written loop, which
+    converts and validates every row on its own, against the batched
+    conversion of Schema.read, on a file of row_count rows (10M by default,
+    about 300 MiB). Both skip malformed rows and note their line numbers.
+    """
+    schema = Schema({'ProductID': str, 'ProductCategory': str, 'SalesRegion': str, 'SaleAmount': float})
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "sales.csv")
+        make_sales_file(filepath, row_count, extra_columns=0)
+
+        def validated_rows(rejects):
+            with open(filepath, 'r') as file_handle:
+                reader = csv.reader(file_handle)
+                next(reader)
+                line_number = 2
+                for row in reader:
+                    if row:
+                        try:
+                            yield row[0], row[1], row[2], float(row[3])
+                        except (IndexError, ValueError) as error:
+                            rejects.add(line_number, None, None, str(error))
+                    line_number = reader.line_num + 1
+
+        def per_row():
+            rejects = RejectReport()
+            for _ in validated_rows(rejects):
+                pass
+            assert rejects.count == 0
+
+        def batched():
+            rejects = RejectReport()
+            with open(filepath, 'r') as file_handle:
+                for _ in schema.read(file_handle, rejects):
+                    pass
+            assert rejects.count == 0
+
+        baseline = _time("validated per row", row_count, per_row)
+        bulk = _time("Schema.read", row_count, batched)
+        print(f"Schema.read speedup: {baseline / bulk:.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_projected_reader()
+    benchmark_parallel_scaling()
+    benchmark_columnar_cache()
+    benchmark_schema_conversion()
@@ -0,0 +1,411 @@
+import csv
+import json
+import mmap
+import os
+import re
+import struct
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from lab5 import AnalysisEngine, EmployeeAggregator, complete_rows, projector, row_width
+
+
+MAGIC = b'CSVCOLS1'
+HEADER_LENGTH = struct.Struct('<Q')
+ALIGNMENT = 8
+BATCH_SIZE = 1 << 16
+
+# Decimal literals that survive a round trip through a scaled 64-bit integer
+DECIMAL = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.([0-9]+))?')
+MAX_EXACT_INTEGER = 2 ** 53
+
+
+def _cache_file_name(filepath: str) -> str:
+    return os.path.join(os.path.dirname(filepath), f".{os.path.basename(filepath)}.columns")
+
+
+def _format_decimal(value: int, scale: int) -> str:
+    """
+    The decimal literal of value / 10 ** scale with exactly scale decimals.
+    """
+    if not scale:
+        return str(value)
+    digits = str(abs(value)).rjust(scale + 1, '0')
+    return f"{'-' if value < 0 else ''}{digits[:-scale]}.{digits[-scale:]}"
+
+
+class _ColumnBuilder:
+    """
+    Encodes the values of one column while the CSV file is read, a batch of rows at a time.
+
+    As long as all values are decimal literals with the same number of
+    decimals, they are kept as integers scaled by 10 ** scale. The first
+    batch that breaks this turns the column into a dictionary-encoded one,
+    re-encoding the values kept so far.
+    """
+
+    def __init__(self) -> None:
+        self.dictionary = {}
+        self.codes = array('I')
+        self.decimals = array('q')
+        self.scale = None
+        self.pattern = None
+
+    def extend(self, values: Sequence[str]) -> None:
+        if self.decimals is not None:
+            numbers = self._decimal_batch(values)
+            if numbers is not None:
+                self.decimals.extend(numbers)
+                return
+
+            previous = [_format_decimal(number, self.scale) for number in self.decimals]
+            self.decimals = None
+            self._encode(previous)
+
+        self._encode(values)
+
+    def _encode(self, values: Sequence[str]) -> None:
+        dictionary = self.dictionary
+        self.codes.extend([dictionary.setdefault(value, len(dictionary)) for value in values])
+
+    def _decimal_batch(self, values: Sequence[Optional[str]]) -> Optional[array]:
+        if not values:
+            return array('q')
+        # A field missing from a short row is None, which only a dictionary can hold
+        if None in values:
+            return None
+
+        if self.pattern is None:
+            match = DECIMAL.fullmatch(values[0])
+            if match is None:
+                return None
+            self.scale = len(match.group(1) or '')
+            literal = r'-?(?:0|[1-9][0-9]*)' + (rf'\.[0-9]{{{self.scale}}}' if self.scale else '')
+            self.pattern = re.compile(rf'{literal}(?:\n{literal})*')
+
+        # One regex run checks the whole batch
+        text = '\n'.join(values)
+        if self.pattern.fullmatch(text) is None:
+            return None
+
+        try:
+            numbers = array('q', map(int, text.replace('.', '').split('\n')))
+        except OverflowError:
+            return None
+        # -0 and -0.00 would come back without their sign
+        negative_zero = '\n-0' + ('.' + '0' * self.scale if self.scale else '') + '\n'
+        # A value holding a newline would have been split in two
+        if len(numbers) != len(values) or max(numbers) >= MAX_EXACT_INTEGER or min(numbers) <= -MAX_EXACT_INTEGER \
+                or negative_zero in f'\n{text}\n':
+            return None
+        return numbers
+
+    def blocks(self) -> Tuple[Dict[str, Any], List[bytes]]:
+        """
+        The column description for the cache header and the data blocks it refers to.
+        """
+        if self.decimals is not None and self.scale is not None:
+            return {'type': 'decimal', 'scale': self.scale}, [self.decimals.tobytes()]
+
+        typecode = 'B' if len(self.dictionary) <= 1 << 8 else 'H' if len(self.dictionary) <= 1 << 16 else 'I'
+        codes = self.codes if typecode == 'I' else array(typecode, self.codes)
+        dictionary = json.dumps(list(self.dictionary)).encode()
+        return {'type': 'string', 'typecode': typecode}, [codes.tobytes(), dictionary]
+
+
+def _extend_columns(builders: Dict[str, _ColumnBuilder], batch: List[Tuple[str, ...]]) -> int:
+    for builder, values in zip(builders.values(), zip(*batch)):
+        builder.extend(values)
+    return len(batch)
+
+
+def build_cache(filepath: str, cache_file: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> str:
+    """
+    Convert a CSV file, or some of its columns, into the columnar cache format.
+
+    Columns whose values are all decimal literals with the same number of
+    decimals are stored as arrays of scaled 64-bit integers, all other
+    columns as arrays of codes into a dictionary of their distinct values.
+    Like csv.DictReader and AnalysisEngine.run, blank lines are skipped and
+    the fields missing from short rows are None. Of several columns with the
+    same name the last one is kept.
+
+    Args:
+        filepath (str): The path to the CSV file.
+        cache_file (str, optional): Where the cache is written. Defaults to
+            .{file name}.columns next to the CSV file.
+        columns (Sequence[str], optional): The columns to store. Defaults to
+            all of them. Names missing from the file are ignored.
+
+    Returns:
+        str: The path of the cache file.
+    """
+    if cache_file is None:
+        cache_file = _cache_file_name(filepath)
+
+    with open(filepath, 'r', encoding='utf-8') as file_handle:
+        stat = os.fstat(file_handle.fileno())
+        reader = csv.reader(file_handle)
+        header = next(reader, [])
+        positions = {name: index for index, name in enumerate(header)}
+        if columns is not None:
+            positions = {name: index for name, index in positions.items() if name in columns}
+        builders = {name: _ColumnBuilder() for name in positions}
+        project = projector(list(positions.values())) if positions else tuple
+
+        row_count = 0
+        batch = []
+        for row in complete_rows(reader, row_width([positions.values()])):
+            batch.append(project(row))
+            if len(batch) == BATCH_SIZE:
+                row_count += _extend_columns(builders, batch)
+                batch = []
+        row_count += _extend_columns(builders, batch)
+
+    descriptions = {}
+    blocks = []
+    offset = 0
+    for name, builder in builders.items():
+        description, column_blocks = builder.blocks()
+        description['blocks'] = []
+        for block in column_blocks:
+            description['blocks'].append((offset, len(block)))
+            padding = -len(block) % ALIGNMENT
+            blocks.append(block + b'\0' * padding)
+            offset += len(block) + padding
+        descriptions[name] = description
+
+    header_data = json.dumps({
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'rows': row_count,
+        'header': header,
+        'columns': descriptions
+    }).encode()
+    header_data += b' ' * (-(len(MAGIC) + HEADER_LENGTH.size + len(header_data)) % ALIGNMENT)
+
+    temporary_file = cache_file + '.tmp'
+    with open(temporary_file, 'wb') as cache_handle:
+        cache_handle.write(MAGIC)
+        cache_handle.write(HEADER_LENGTH.pack(len(header_data)))
+        cache_handle.write(header_data)
+        for block in blocks:
+            cache_handle.write(block)
+    os.replace(temporary_file, cache_file)
+
+    return cache_file
+
+
+def _read_header(cache_handle) -> Optional[Dict[str, Any]]:
+    """
+    The metadata of a cache file, or None if it is not a cache file or its
+    header is truncated or corrupt.
+    """
+    cache_handle.seek(0)
+    if cache_handle.read(len(MAGIC)) != MAGIC:
+        return None
+    length_data = cache_handle.read(HEADER_LENGTH.size)
+    if len(length_data) < HEADER_LENGTH.size:
+        return None
+    length = HEADER_LENGTH.unpack(length_data)[0]
+    header_data = cache_handle.read(length)
+    if len(header_data) < length:
+        return None
+
+    try:
+        metadata = json.loads(header_data)
+    except ValueError:
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+class ColumnarCache:
+    """
+    A columnar cache file, memory-mapped for reading.
+
+    Only the columns asked for are touched: their arrays are read straight
+    from the memory map and their dictionaries are decoded on first use.
+
+    Attributes:
+        header (List[str]): The column names of the source CSV file.
+        row_count (int): The number of rows.
+    """
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self.file_handle = open(cache_file, 'rb')
+        self.metadata = _read_header(self.file_handle)
+        if self.metadata is None:
+            self.file_handle.close()
+            raise ValueError(f"{cache_file} is not a columnar cache file")
+
+        self.header = self.metadata['header']
+        self.row_count = self.metadata['rows']
+        self.start = self.file_handle.tell()
+
+        # A cache cut short while it was copied or written holds only part of its columns
+        end = max((offset + length for description in self.metadata['columns'].values()
+                   for offset, length in description['blocks']), default=0)
+        if self.start + end > os.fstat(self.file_handle.fileno()).st_size:
+            self.file_handle.close()
+            raise ValueError(f"{cache_file} is truncated")
+
+        self.buffer = mmap.mmap(self.file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.views = []
+        self.dictionaries = {}
+
+    def __enter__(self) -> 'ColumnarCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in self.views:
+            view.release()
+        self.views = []
+        self.buffer.close()
+        self.file_handle.close()
+
+    def is_fresh(self, filepath: str) -> bool:
+        """
+        Whether the cache was built from the current version of a CSV file,
+        judged by the size and modification time of the file.
+        """
+        stat = os.stat(filepath)
+        return self.metadata['size'] == stat.st_size and self.metadata['mtime_ns'] == stat.st_mtime_ns
+
+    def _block(self, column: str, index: int, typecode: str = 'B') -> memoryview:
+        offset, length = self.metadata['columns'][column]['blocks'][index]
+        whole = memoryview(self.buffer)
+        part = whole[self.start + offset:self.start + offset + length]
+        view = part.cast(typecode)
+        # Released in this order by close, before the memory map is closed
+        self.views.extend((view, part, whole))
+        return view
+
+    def values(self, column: str, numeric: bool = False) -> Iterator[Any]:
+        """
+        Iterate over the values of one column.
+
+        Args:
+            column (str): The column name.
+            numeric (bool): Return decimal columns as floats instead of strings.
+                The floats equal float() of the original strings.
+
+        Returns:
+            Iterator[Any]: The value of every row, as a string or a float, or
+            None for a field missing from a short row.
+
+        Raises:
+            ValueError: If the column is not in the cache.
+        """
+        description = self.metadata['columns'].get(column)
+        if description is None:
+            raise ValueError(f"The column {column} is not cached")
+
+        if description['type'] == 'decimal':
+            numbers = self._block(column, 0, 'q')
+            scale = description['scale']
+            if numeric:
+                # Dividing two exact integers rounds like float() of the literal
+                divisor = 10 ** scale
+                return (number / divisor for number in numbers)
+            return (_format_decimal(number, scale) for number in numbers)
+
+        dictionary = self.dictionaries.get(column)
+        if dictionary is None:
+            dictionary = self.dictionaries[column] = json.loads(bytes(self._block(column, 1)))
+        return map(dictionary.__getitem__, self._block(column, 0, description['typecode']))
+
+
+def open_cache(filepath: str, cache_file: Optional[str] = None, columns: Optional[Sequence[str]] = None
+               ) -> ColumnarCache:
+    """
+    Open the columnar cache of a CSV file, building it first if it is missing,
+    lacks one of the columns or the file changed size or modification time
+    since it was built. A cache is only extended with the columns asked for,
+    so the first analysis does not pay for converting columns it never reads.
+
+    Args:
+        filepath (str): The path to the CSV file.
+        cache_file (str, optional): Where the cache is kept. Defaults to
+            .{file name}.columns next to the CSV file.
+        columns (Sequence[str], optional): The columns that have to be cached.
+            Defaults to all of them.
+
+    Returns:
+        ColumnarCache: The open cache. Close it when done.
+
+    Raises:
+        Exception: If the CSV file does not exist.
+    """
+    if not os.path.exists(filepath):
+        raise Exception("File Not Found")
+    if cache_file is None:
+        cache_file = _cache_file_name(filepath)
+
+    cached = []
+    if os.path.exists(cache_file):
+        try:
+            cache = ColumnarCache(cache_file)
+        except ValueError:
+            cache = None
+        if cache is not None:
+            if cache.is_fresh(filepath):
+                wanted = cache.header if columns is None else columns
+                if all(column in cache.metadata['columns'] or column not in cache.header for column in wanted):
+                    return cache
+                cached = list(cache.metadata['columns'])
+            cache.close()
+
+    if columns is not None:
+        columns = cached + [column for column in columns if column not in cached]
+    return ColumnarCache(build_cache(filepath, cache_file, columns))
+
+
+def run_cached(engine: AnalysisEngine, filepath: str, cache_file: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Like AnalysisEngine.run, but the rows come from the columnar cache of the
+    file, so only the columns the aggregators read are loaded. Columns an
+    aggregator declares numeric are handed over as floats.
+
+    Args:
+        engine (AnalysisEngine): The engine with the registered aggregators.
+        filepath (str): The path to the CSV file.
+        cache_file (str, optional): Where the cache is kept, see open_cache.
+
+    Returns:
+        Dict[str, Any]: The report of every aggregator by name.
+
+    Raises:
+        ValueError: If the file lacks a column an aggregator reads.
+    """
+    needed = [column for aggregator in engine.aggregators.values() for column in aggregator.columns]
+    engine.reset()
+    with open_cache(filepath, cache_file, needed) as cache:
+        engine.check_columns(cache.header)
+
+        for aggregator in engine.aggregators.values():
+            columns = [cache.values(column, column in aggregator.numeric_columns) for column in aggregator.columns]
+            add = aggregator.add
+            for values in zip(*columns):
+                add(values)
+
+    return engine.results()
+
+
+def analyze_employee_data_cached(filepath: str, cache_file: Optional[str] = None) -> Any:
+    """
+    Same result as analyze_employee_data, read from the columnar cache of the file.
+
+    Args:
+        filepath (str): The path to the CSV file containing employee data.
+        cache_file (str, optional): Where the cache is kept, see open_cache.
+
+    Returns:
+        Tuple[int, dict, str, List[Tuple[float, str]]]: The analyze_employee_data report.
+    """
+    engine = AnalysisEngine()
+    engine.register('report', EmployeeAggregator())
+    return run_cached(engine, filepath, cache_file)['report']
@@ -1,68 +1,1449 @@
 import csv
-from typing import Any, Dict, List, Tuple
+import io
+import json
+import math
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappush, heapreplace
+from itertools import chain, islice, repeat
+from operator import itemgetter
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO
+from typing import Tuple, Type
 
-def analyze_employee_data(filepath: str) -> Tuple[int, dict, str, List[Tuple[float, str]]]:
+
+READ_BLOCK_SIZE = 1 << 24
+
+
+def _add_exact(partials: List[float], value: float) -> None:
+    """
+    Add a value to a sum kept as non-overlapping partials (Shewchuk's
+    algorithm, as used by math.fsum). math.fsum(partials) is the correctly
+    rounded sum, whatever the order the values were added or merged in.
+    """
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+
+
+def projector(keys: Sequence[Any]) -> Callable[[Any], Tuple]:
+    """
+    An itemgetter that always returns a tuple, even for a single key.
+
+    Args:
+        keys (Sequence[Any]): The keys or positions to pick, at least one.
+
+    Returns:
+        Callable[[Any], Tuple]: Picks the values at keys from a row.
+    """
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: (row[key],)
+    return itemgetter(*keys)
+
+
+def column_indices(header: Sequence[str], columns: Sequence[str]) -> List[int]:
+    """
+    Resolve column names to their positions in a CSV header.
+
+    Args:
+        header (Sequence[str]): The column names of the CSV file.
+        columns (Sequence[str]): The column names to look up.
+
+    Returns:
+        List[int]: The position of every requested column.
+
+    Raises:
+        ValueError: If a column is missing from the header.
+    """
+    # Like csv.DictReader, the last of several columns with the same name wins
+    positions = {name: index for index, name in enumerate(header)}
+    missing = [column for column in columns if column not in positions]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return [positions[column] for column in columns]
+
+
+def row_width(indices: Iterable[Sequence[int]]) -> int:
+    """
+    The number of fields a row needs to have every column at the given
+    positions, at least 1 so that blank rows are always skipped.
+
+    Args:
+        indices (Iterable[Sequence[int]]): The column positions read by every consumer.
+
+    Returns:
+        int: The width to pass to complete_rows.
+    """
+    return 1 + max(chain.from_iterable(indices), default=0)
+
+
+def complete_rows(rows: Iterable[List[str]], width: int) -> Iterator[List[Optional[str]]]:
+    """
+    The non-blank rows parsed by csv.reader, with the fields missing from
+    rows shorter than width read as None, like csv.DictReader does.
+
+    Args:
+        rows (Iterable[List[str]]): The rows parsed by csv.reader. Short rows are padded in place.
+        width (int): The number of fields every row needs, see row_width.
+
+    Returns:
+        Iterator[List[Optional[str]]]: The non-blank rows, at least width fields long.
+    """
+    for row in rows:
+        if len(row) < width:
+            if not row:
+                continue
+            row += [None] * (width - len(row))
+        yield row
+
+
+def read_projected(file_handle: TextIO, columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    """
+    Read only some columns of a CSV file, much cheaper than csv.DictReader for wide files.
+
+    The header is read once to resolve the column positions, then every row
+    is parsed with csv.reader and projected with operator.itemgetter, so no
+    per-row dict is built. Like csv.DictReader, blank lines are skipped and
+    the fields missing from short rows are None.
+
+    Args:
+        file_handle (TextIO): The open CSV file, positioned at its header.
+        columns (Sequence[str]): The columns to read.
+
+    Returns:
+        Iterator[Tuple[str, ...]]: The requested values of every row, in the order of columns.
+
+    Raises:
+        ValueError: If a column is missing from the header.
+    """
+    reader = csv.reader(file_handle)
+    indices = column_indices(next(reader, []), columns)
+    project = projector(indices)
+
+    for row in complete_rows(reader, row_width([indices])):
+        yield project(row)
+
+
+class RejectReport:
+    """
+    The malformed rows skipped by a validated run, instead of aborting it.
+
+    Every rejected row is counted, but only the first max_rows are kept with
+    their details, so a file full of bad rows cannot exhaust memory.
+
+    Attributes:
+        count (int): The number of rejected rows.
+        rows (List[Tuple[int, Optional[str], Optional[str], str]]): In line
+            order, the line number where each kept row starts, the column and the value that
+            failed (None for a row with missing fields) and the reason.
+    """
+
+    def __init__(self, max_rows: int = 1000) -> None:
+        self.max_rows = max_rows
+        self.count = 0
+        self.rows = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, line_number: int, column: Optional[str], value: Optional[str], reason: str) -> None:
+        self.count += 1
+        if len(self.rows) < self.max_rows:
+            self.rows.append((line_number, column, value, reason))
+
+    def write(self, file_name: str) -> None:
+        """
+        Write the kept rows as CSV with a line, column, value and reason column.
+        """
+        with open(file_name, 'w', newline='') as report_file:
+            writer = csv.writer(report_file)
+            writer.writerow(['line', 'column', 'value', 'reason'])
+            writer.writerows(self.rows)
+
+
+def _read_records(file_handle: TextIO, size: int) -> str:
+    """
+    About size characters of a CSV file, extended to the end of the line and
+    past the newlines inside a quoted field, so that they hold whole records.
+    Like _record_start, every quote is taken to open or close a quoted field.
+    """
+    text = file_handle.read(size)
+    if text and not text.endswith('\n'):
+        text += file_handle.readline()
+
+    if text.count('"') % 2:
+        lines = [text]
+        for line in iter(file_handle.readline, ''):
+            lines.append(line)
+            if line.count('"') % 2:
+                break
+        text = ''.join(lines)
+    return text
+
+
+def _record_line_numbers(batch: List[List[str]], line_number: int) -> List[int]:
+    """
+    The line numbers where the non-blank rows of a batch start, the first row
+    of the batch starting at line_number. A row spans one line plus one for
+    every newline inside its quoted fields.
+    """
+    line_numbers = []
+    for row in batch:
+        if row:
+            line_numbers.append(line_number)
+        line_number += 1 + sum(field.count('\n') for field in row)
+    return line_numbers
+
+
+class Schema:
+    """
+    The types of the columns of a CSV file, declared once and applied to
+    whole batches of rows.
+
+    A type is any callable converting the string of a field, like int or
+    float; str leaves the field as it is. The file is read in blocks of
+    whole records. A block of plain rows, without quotes or blank lines and
+    with as many fields as the header, is split into its fields with one
+    str.split call; every column is then a slice of them, converted with one
+    map() call and no try block per row. Other blocks are parsed with
+    csv.reader first. Only when the conversion fails is the block converted
+    row by row to find the malformed rows, which are then reported to a
+    RejectReport and skipped.
+
+    Attributes:
+        types (Dict[str, Callable[[str], Any]]): The type of every column, in the order of the typed rows.
+    """
+
+    def __init__(self, types: Mapping[str, Callable[[str], Any]]) -> None:
+        self.types = dict(types)
+
+    @classmethod
+    def infer(cls, file_handle: TextIO, sample_rows: int = 1000) -> 'Schema':
+        """
+        Guess the column types from the first rows of a CSV file: int if every
+        sampled value is an integer, float if every one is a number, else str.
+
+        Args:
+            file_handle (TextIO): The open CSV file, positioned at its header.
+                It is read up to sample_rows rows past the header.
+            sample_rows (int): The number of rows looked at.
+
+        Returns:
+            Schema: The guessed schema of all columns.
+        """
+        reader = csv.reader(file_handle)
+        header = next(reader, [])
+        samples = [row for row in islice(reader, sample_rows) if len(row) == len(header)]
+
+        types = {}
+        for name, values in zip(header, zip(*samples) if samples else [()] * len(header)):
+            types[name] = str
+            for candidate in (int, float):
+                try:
+                    list(map(candidate, values))
+                except ValueError:
+                    continue
+                types[name] = candidate if values else str
+                break
+        return cls(types)
+
+    def read(self, file_handle: TextIO, rejects: Optional[RejectReport] = None,
+             block_size: int = 1 << 14) -> Iterator[Tuple[Any, ...]]:
+        """
+        Read the typed values of the schema columns from a CSV file.
+
+        Args:
+            file_handle (TextIO): The open CSV file, positioned at its header.
+            rejects (RejectReport, optional): Collects the malformed rows. Without
+                it the first malformed row raises ValueError.
+            block_size (int): The number of characters converted at once,
+                extended to the end of the last record.
+
+        Returns:
+            Iterator[Tuple[Any, ...]]: The converted values of every valid row,
+            in the order of the schema columns. Blank lines are skipped.
+
+        Raises:
+            ValueError: If a schema column is missing from the header, or a row
+                is malformed and no RejectReport is given.
+        """
+        if rejects is None:
+            rejects = _RaisingRejectReport()
+        return chain.from_iterable(self._read_batches(file_handle, rejects, block_size))
+
+    def _read_batches(self, file_handle: TextIO, rejects: RejectReport,
+                      block_size: int) -> Iterator[List[Tuple[Any, ...]]]:
+        reader = csv.reader(file_handle)
+        header = next(reader, [])
+        indices = column_indices(header, list(self.types))
+        convert = self._row_converter(indices)
+
+        line_number = reader.line_num + 1
+        for text in iter(lambda: _read_records(file_handle, block_size), ''):
+            yield self._convert(text, line_number, convert, indices, len(header), rejects)
+            line_number += text.count('\n')
+            if '\r' in text:
+                line_number += text.count('\r') - text.count('\r\n')
+
+    def _row_converter(self, indices: Sequence[int]) -> Callable[[List[str]], Tuple[Any, ...]]:
+        """
+        A function picking the schema columns of a parsed row and converting each one.
+        """
+        pick = projector(indices)
+        converters = tuple(self.types.values())
+        return lambda row: tuple([convert(value) for convert, value in zip(converters, pick(row))])
+
+    def _split_fields(self, text: str, field_count: int) -> Optional[List[str]]:
+        """
+        All fields of a block of CSV records in one list, the field_count
+        fields of every row followed by a newline, except for the last row.
+        None unless every row is a plain one: not blank, exactly field_count
+        fields and no quotes, carriage returns or NUL characters.
+        """
+        if '"' in text or '\r' in text or '\0' in text or '\n\n' in text or text.startswith('\n'):
+            return None
+        if text.endswith('\n'):
+            text = text[:-1]
+
+        row_count = text.count('\n') + 1
+        fields = text.replace('\n', ',\n,').split(',')
+        # Every row has field_count fields if and only if each '\n' ends up at the end of a row
+        if len(fields) != (field_count + 1) * row_count - 1 \
+                or fields[field_count::field_count + 1].count('\n') != row_count - 1:
+            return None
+        return fields
+
+    def _convert(self, text: str, line_number: int, convert: Callable[[List[str]], Tuple[Any, ...]],
+                 indices: List[int], field_count: int, rejects: RejectReport) -> List[Tuple[Any, ...]]:
+        """
+        Convert a block of whole CSV records, the first one starting at
+        line_number. A block of plain rows is split at once and every column
+        is a slice of its fields, others are parsed with csv.reader. Only a
+        block with a malformed row is converted again row by row, to report
+        the malformed ones in line order.
+        """
+        converters = self.types.values()
+        fields = self._split_fields(text, field_count)
+        if fields is not None:
+            try:
+                return list(zip(*[fields[index::field_count + 1] if convert_column is str
+                                  else map(convert_column, fields[index::field_count + 1])
+                                  for convert_column, index in zip(converters, indices)]))
+            except (ValueError, TypeError):
+                pass
+
+        batch = list(csv.reader(io.StringIO(text, newline='')))
+        rows = batch if all(batch) else [row for row in batch if row]
+        if fields is None:
+            try:
+                # zip stops at the shortest row, so a short row leaves a column missing
+                columns = list(zip(*rows))
+                return list(zip(*[columns[index] if convert_column is str else map(convert_column, columns[index])
+                                  for convert_column, index in zip(converters, indices)]))
+            except (IndexError, ValueError, TypeError):
+                pass
+
+        typed = []
+        for row, row_line_number in zip(rows, _record_line_numbers(batch, line_number)):
+            try:
+                typed.append(convert(row))
+            except IndexError:
+                rejects.add(row_line_number, None, None, f"expected {field_count} fields, got {len(row)}")
+            except (ValueError, TypeError) as error:
+                rejects.add(row_line_number, *self._first_error(row, indices, error))
+        return typed
+
+    def _first_error(self, row: List[str], indices: List[int],
+                     error: Exception) -> Tuple[Optional[str], Optional[str], str]:
+        """
+        The column, value and reason of the first field of a row that fails to
+        convert, or no column and value with the reason of error if none fails
+        on its own.
+        """
+        for (name, convert), index in zip(self.types.items(), indices):
+            try:
+                convert(row[index])
+            except (ValueError, TypeError) as field_error:
+                return name, row[index], str(field_error)
+        return None, None, str(error)
+
+
+class _RaisingRejectReport(RejectReport):
+    """
+    Turns the first malformed row into a ValueError, for reads without a RejectReport.
+    """
+
+    def add(self, line_number: int, column: Optional[str], value: Optional[str], reason: str) -> None:
+        raise ValueError(f"Line {line_number}: {reason}")
+
+
+class _LineTracker:
+    """
+    Feeds the newline-terminated lines of a binary file to csv.reader and
+    keeps the byte offset after the last line handed over. Newlines are
+    translated like a file opened in text mode. An unterminated last line is
+    not handed over.
+
+    Attributes:
+        offset (int): The byte offset after the last line read.
+        exhausted (bool): Whether all complete lines have been read.
+    """
+
+    def __init__(self, file_handle: BinaryIO, encoding: str) -> None:
+        self.file_handle = file_handle
+        self.encoding = encoding
+        self.offset = file_handle.tell()
+        self.exhausted = False
+
+    def seek(self, offset: int) -> None:
+        self.file_handle.seek(offset)
+        self.offset = offset
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            line = self.file_handle.readline()
+            if not line.endswith(b'\n'):
+                self.exhausted = True
+                return
+            self.offset += len(line)
+            line = line.decode(self.encoding)
+            if '\r' in line:
+                yield from io.StringIO(line, newline=None)
+            else:
+                yield line
+
+
+def _record_start(file_handle: BinaryIO, position: int, in_quotes: bool) -> int:
+    """
+    The first byte offset at or after position where a CSV record starts,
+    i.e. just after a newline that is not inside a quoted field, or the end
+    of the file. in_quotes tells whether position is inside a quoted field.
+    Quote characters are assumed to only appear in quoted fields, where a
+    literal quote is doubled, so every quote toggles between the two states.
+    """
+    file_handle.seek(position)
+    for line in iter(file_handle.readline, b''):
+        if line.count(b'"') % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            break
+    return file_handle.tell()
+
+
+def _count_quotes(filepath: str, start: int, end: int) -> int:
+    """
+    The number of quote characters in the byte range [start, end) of a file.
+    """
+    count = 0
+    with open(filepath, 'rb') as file_handle:
+        file_handle.seek(start)
+        while start < end:
+            block = file_handle.read(min(READ_BLOCK_SIZE, end - start))
+            if not block:
+                break
+            count += block.count(b'"')
+            start += len(block)
+    return count
+
+
+def _record_aligned_ranges(filepath: str, parts: int, executor: ProcessPoolExecutor) -> List[Tuple[int, int]]:
+    """
+    Split the rows of a CSV file into about parts (start, end) byte ranges
+    that each begin at the start of a record, so no range splits a quoted
+    field holding a newline. The quotes before every split point are counted
+    by the executor to know whether the split point is inside a quoted field.
+    The first range begins after the header.
+    """
+    file_size = os.path.getsize(filepath)
+
+    with open(filepath, 'rb') as file_handle:
+        header_end = _record_start(file_handle, 0, False)
+        nominal = [header_end + (file_size - header_end) * i // parts for i in range(parts + 1)]
+
+        quote_counts = list(executor.map(_count_quotes, repeat(filepath), [0] + nominal[1:-1], nominal[1:-1]))
+        starts = [header_end]
+        quotes = 0
+        for position, count in zip(nominal[1:-1], quote_counts):
+            quotes += count
+            starts.append(max(_record_start(file_handle, position, quotes % 2 == 1), starts[-1]))
+
+    starts.append(file_size)
+    return [(start, end) for start, end in zip(starts, starts[1:]) if start < end]
+
+
+def _range_lines(filepath: str, start: int, end: int, encoding: str) -> Iterator[str]:
+    """
+    The lines of the record-aligned byte range [start, end) of a file, decoded
+    with newlines translated like a file opened in text mode.
+    """
+    with open(filepath, 'rb') as file_handle:
+        file_handle.seek(start)
+        while start < end:
+            block = file_handle.read(min(READ_BLOCK_SIZE, end - start))
+            if not block:
+                break
+            # Finish the last line, so a block never ends inside a character
+            if not block.endswith(b'\n'):
+                block += file_handle.readline()
+            start += len(block)
+            yield from io.StringIO(block.decode(encoding), newline=None)
+
+
+class Aggregator(ABC):
+    """
+    A report that is computed row by row, so several reports can share one
+    pass over a CSV file. Rows are handed over already projected to the
+    columns the aggregator declares.
+
+    Attributes:
+        columns (Tuple[str, ...]): The CSV columns the aggregator reads.
+        numeric_columns (Tuple[str, ...]): The columns only read through float(),
+            which may be handed over as floats instead of strings.
+    """
+
+    columns: Tuple[str, ...] = ()
+    numeric_columns: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def add(self, values: Tuple[str, ...]) -> None:
+        """
+        Update the aggregate with one CSV row.
+
+        Args:
+            values (Tuple[str, ...]): The values of the row, in the order of columns.
+        """
+
+    @abstractmethod
+    def result(self) -> Any:
+        """
+        Compute the report from the rows added so far.
+
+        Returns:
+            Any: The report.
+        """
+
+    def fresh(self) -> 'Aggregator':
+        """
+        Returns:
+            Aggregator: An empty aggregator computing the same report, e.g. for a worker process.
+        """
+        return type(self)()
+
+    def reset(self) -> None:
+        """
+        Forget all rows added so far.
+        """
+        self.load_state(self.fresh().to_state())
+
+    @abstractmethod
+    def merge(self, other: 'Aggregator') -> None:
+        """
+        Add the rows seen by another aggregator of the same type, as if they
+        had been added to this one after its own rows.
+
+        Args:
+            other (Aggregator): The aggregator to merge in.
+        """
+
+    @abstractmethod
+    def to_state(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: The partial aggregate as plain JSON-serializable data.
+        """
+
+    @abstractmethod
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """
+        Replace the partial aggregate with one saved by to_state.
+
+        Args:
+            state (Dict[str, Any]): The saved partial aggregate.
+        """
+
+
+class EmployeeAggregator(Aggregator):
+    """
+    The analyze_employee_data report.
+
+    Attributes:
+        employees_num (int): The number of employees seen.
+        employees_by_gender (dict): The employee counts by gender.
+        joblevel_count (dict): The employee counts by job level.
+        highest_male (float): The highest male problem-solving score so far.
+        highest_female (float): The highest problem-solving score of everyone else so far.
+    """
+
+    columns = ('Gender', 'JobLevel', 'ProblemSolvingScore')
+    numeric_columns = ('ProblemSolvingScore',)
+
+    def __init__(self) -> None:
+        self.employees_num = 0
+        self.employees_by_gender = {'Male': 0, 'Female': 0}
+        self.joblevel_count = {}
+        self.highest_male = None
+        self.highest_female = None
+
+    def add(self, values: Tuple[str, ...]) -> None:
+        self.employees_num += 1
+
+        gender, job_level, problem_solving_score = values
+
+        if gender in self.employees_by_gender:
+            self.employees_by_gender[gender] += 1
+
+        if job_level in self.joblevel_count:
+            self.joblevel_count[job_level] += 1
+        else:
+            self.joblevel_count[job_level] = 1
+
+        problem_solving_score = float(problem_solving_score)
+
+        if gender == 'Male':
+            if self.highest_male is None or problem_solving_score > self.highest_male:
+                self.highest_male = problem_solving_score
+        elif self.highest_female is None or problem_solving_score > self.highest_female:
+            self.highest_female = problem_solving_score
+
+    def result(self) -> Tuple[int, dict, str, List[Tuple[float, str]]]:
+        if self.highest_male is None or self.highest_female is None:
+            raise ValueError("max() arg is an empty sequence")
+
+        performance_by_employee = [
+            (self.highest_male, 'Male'),
+            (self.highest_female, 'Female')
+        ]
+
+        highest_ps_list = sorted(performance_by_employee)
+        common_joblevel = max(self.joblevel_count, key=self.joblevel_count.get)
+
+        return self.employees_num, self.employees_by_gender, common_joblevel, highest_ps_list
+
+    def merge(self, other: 'EmployeeAggregator') -> None:
+        self.employees_num += other.employees_num
+
+        for gender, count in other.employees_by_gender.items():
+            self.employees_by_gender[gender] += count
+
+        for job_level, count in other.joblevel_count.items():
+            self.joblevel_count[job_level] = self.joblevel_count.get(job_level, 0) + count
+
+        if other.highest_male is not None and (self.highest_male is None or other.highest_male > self.highest_male):
+            self.highest_male = other.highest_male
+        if other.highest_female is not None and (self.highest_female is None
+                                                 or other.highest_female > self.highest_female):
+            self.highest_female = other.highest_female
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'employees_num': self.employees_num,
+            'employees_by_gender': dict(self.employees_by_gender),
+            'joblevel_count': dict(self.joblevel_count),
+            'highest_male': self.highest_male,
+            'highest_female': self.highest_female
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.employees_num = state['employees_num']
+        self.employees_by_gender = dict(state['employees_by_gender'])
+        self.joblevel_count = dict(state['joblevel_count'])
+        self.highest_male = state['highest_male']
+        self.highest_female = state['highest_female']
+
+
+class SalesAggregator(Aggregator):
+    """
+    The analyze_sales_data report, computed in constant memory per category,
+    region and tied product ID.
+
+    Attributes:
+        sales_by_productcategory (dict): The sale counts by product category.
+        salesregion_amounts (dict): The total sale amount by sales region, as exact
+            partial sums so that merged partial aggregates add up to the same total.
+        salesregion_counts (dict): The sale counts by sales region.
+        max_saleamount (float): The highest sale amount so far.
+        highest_productid (list): The product IDs of the sales with the highest amount so far.
+    """
+
+    columns = ('ProductID', 'ProductCategory', 'SalesRegion', 'SaleAmount')
+    numeric_columns = ('SaleAmount',)
+
+    def __init__(self) -> None:
+        self.sales_by_productcategory = {}
+        self.salesregion_amounts = {}
+        self.salesregion_counts = {}
+        self.max_saleamount = None
+        self.highest_productid = []
+
+    def add(self, values: Tuple[str, ...]) -> None:
+        product_id, product_category, sales_region, sale_amount = values
+
+        if product_category in self.sales_by_productcategory:
+            self.sales_by_productcategory[product_category] += 1
+        else:
+            self.sales_by_productcategory[product_category] = 1
+
+        sale_amount = float(sale_amount)
+        if sales_region in self.salesregion_amounts:
+            _add_exact(self.salesregion_amounts[sales_region], sale_amount)
+            self.salesregion_counts[sales_region] += 1
+        else:
+            self.salesregion_amounts[sales_region] = [sale_amount]
+            self.salesregion_counts[sales_region] = 1
+
+        if self.max_saleamount is None or sale_amount > self.max_saleamount:
+            self.max_saleamount = sale_amount
+            self.highest_productid = [product_id]
+        elif sale_amount == self.max_saleamount:
+            self.highest_productid.append(product_id)
+
+    def result(self) -> Tuple[Dict[str, int], Dict[str, float], float, List[str]]:
+        if self.max_saleamount is None:
+            raise ValueError("max() arg is an empty sequence")
+
+        salesregion_avg = {region: round(math.fsum(partials) / self.salesregion_counts[region], 2)
+                           for region, partials in self.salesregion_amounts.items()}
+
+        return self.sales_by_productcategory, salesregion_avg, self.max_saleamount, list(self.highest_productid)
+
+    def merge(self, other: 'SalesAggregator') -> None:
+        for product_category, count in other.sales_by_productcategory.items():
+            if product_category in self.sales_by_productcategory:
+                self.sales_by_productcategory[product_category] += count
+            else:
+                self.sales_by_productcategory[product_category] = count
+
+        for sales_region, partials in other.salesregion_amounts.items():
+            if sales_region in self.salesregion_amounts:
+                for partial in partials:
+                    _add_exact(self.salesregion_amounts[sales_region], partial)
+                self.salesregion_counts[sales_region] += other.salesregion_counts[sales_region]
+            else:
+                self.salesregion_amounts[sales_region] = list(partials)
+                self.salesregion_counts[sales_region] = other.salesregion_counts[sales_region]
+
+        if other.max_saleamount is None:
+            return
+        if self.max_saleamount is None or other.max_saleamount > self.max_saleamount:
+            self.max_saleamount = other.max_saleamount
+            self.highest_productid = list(other.highest_productid)
+        elif other.max_saleamount == self.max_saleamount:
+            self.highest_productid.extend(other.highest_productid)
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'sales_by_productcategory': dict(self.sales_by_productcategory),
+            'salesregion_amounts': {region: list(partials) for region, partials in self.salesregion_amounts.items()},
+            'salesregion_counts': dict(self.salesregion_counts),
+            'max_saleamount': self.max_saleamount,
+            'highest_productid': list(self.highest_productid)
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.sales_by_productcategory = dict(state['sales_by_productcategory'])
+        self.salesregion_amounts = {region: list(partials) for region, partials in state['salesregion_amounts'].items()}
+        self.salesregion_counts = dict(state['salesregion_counts'])
+        self.max_saleamount = state['max_saleamount']
+        self.highest_productid = list(state['highest_productid'])
+
+
+class BankAggregator(Aggregator):
+    """
+    The analyze_bank_data report.
+
+    Attributes:
+        deposit_list (set): The descriptions of deposit transactions.
+        withdrawal_list (set): The descriptions of withdrawal transactions.
+    """
+
+    columns = ('TransactionType', 'TransactionDescription')
+
+    def __init__(self) -> None:
+        self.deposit_list = set()
+        self.withdrawal_list = set()
+
+    def add(self, values: Tuple[str, ...]) -> None:
+        transaction_type, transaction_description = values
+
+        if transaction_type == "Deposit":
+            self.deposit_list.add(transaction_description)
+        elif transaction_type == "Withdrawal":
+            self.withdrawal_list.add(transaction_description)
+
+    def result(self) -> Dict[str, Any]:
+        common = self.deposit_list.intersection(self.withdrawal_list)
+
+        only_deposit = sorted(list(self.deposit_list - common))
+        only_withdrawal = sorted(list(self.withdrawal_list - common))
+        common = sorted(list(common))
+        exclusive_count = len(only_deposit) + len(only_withdrawal)
+
+        return {
+            'only_deposit': only_deposit,
+            'common': common,
+            'only_withdrawal': only_withdrawal,
+            'exclusive_count': exclusive_count
+        }
+
+    def merge(self, other: 'BankAggregator') -> None:
+        self.deposit_list |= other.deposit_list
+        self.withdrawal_list |= other.withdrawal_list
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'deposit_list': sorted(self.deposit_list),
+            'withdrawal_list': sorted(self.withdrawal_list)
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.deposit_list = set(state['deposit_list'])
+        self.withdrawal_list = set(state['withdrawal_list'])
+
+
+class TDigest:
+    """
+    A streaming quantile sketch (a merging t-digest).
+
+    Values are buffered and periodically merged into weighted centroids,
+    which are kept small near the tails and larger in the middle, so
+    extreme quantiles stay accurate. The number of centroids is bounded by
+    the compression, whatever the number of values, and two digests can be
+    merged. While no centroid holds more than one value the quantiles are
+    exact and interpolate linearly like numpy.percentile.
+
+    Attributes:
+        compression (int): The size parameter; at most about compression / 2 centroids are kept.
+        count (int): The number of values added.
+        min (float): The smallest value added.
+        max (float): The largest value added.
+    """
+
+    def __init__(self, compression: int = 100) -> None:
+        self.compression = compression
+        self.centroids = []  # sorted [mean, weight] pairs
+        self.buffer = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.buffer.append(value)
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self.buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other: 'TDigest') -> None:
+        """
+        Add the values summarized by another digest.
+
+        Args:
+            other (TDigest): The digest to merge in.
+        """
+        self.centroids.extend([mean, weight] for mean, weight in other.centroids)
+        self.buffer.extend(other.buffer)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def _scale(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _quantile_limit(self, k: float) -> float:
+        k = min(k, self.compression / 4)
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _compress(self) -> None:
+        points = sorted(self.centroids + [[value, 1] for value in self.buffer])
+        self.buffer = []
+        if not points:
+            return
+
+        total = sum(weight for _, weight in points)
+        merged = [list(points[0])]
+        weight_before = 0
+        limit = self._quantile_limit(self._scale(0) + 1)
+
+        for mean, weight in points[1:]:
+            current = merged[-1]
+            if (weight_before + current[1] + weight) / total <= limit:
+                current[0] += (mean - current[0]) * weight / (current[1] + weight)
+                current[1] += weight
+            else:
+                weight_before += current[1]
+                limit = self._quantile_limit(self._scale(weight_before / total) + 1)
+                merged.append([mean, weight])
+
+        self.centroids = merged
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the values added.
+
+        Args:
+            q (float): The quantile, between 0 and 1, e.g. 0.5 for the median.
+
+        Returns:
+            float: The estimate, or nan if no value was added.
+
+        Raises:
+            ValueError: If q is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.buffer:
+            self._compress()
+        if not self.count:
+            return math.nan
+
+        # Every centroid sits at the middle of the ranks of its values,
+        # with the exact min and max at the first and the last rank
+        target = q * (self.count - 1)
+        position, value = 0.0, self.min
+        rank = 0
+        for mean, weight in self.centroids:
+            center = rank + (weight - 1) / 2
+            if target <= center:
+                if center == position:
+                    return mean
+                return value + (mean - value) * (target - position) / (center - position)
+            position, value = center, mean
+            rank += weight
+
+        if self.count - 1 == position:
+            return self.max
+        return value + (self.max - value) * (target - position) / (self.count - 1 - position)
+
+    def to_state(self) -> Dict[str, Any]:
+        if self.buffer:
+            self._compress()
+        return {'compression': self.compression, 'centroids': self.centroids, 'count': self.count,
+                'min': self.min if self.count else None, 'max': self.max if self.count else None}
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.compression = state['compression']
+        self.centroids = [list(centroid) for centroid in state['centroids']]
+        self.buffer = []
+        self.count = state['count']
+        self.min = math.inf if state['min'] is None else state['min']
+        self.max = -math.inf if state['max'] is None else state['max']
+
+
+class GroupStatsAggregator(Aggregator):
+    """
+    Statistics of a numeric column for every value of a grouping column, e.g.
+    problem-solving scores by gender or by department.
+
+    Every group keeps its count, exact sum, min and max, its k largest values
+    in a bounded heap and a TDigest for the quantiles, so the memory per group
+    does not grow with its number of rows. Ties for the k largest values are
+    won by the earlier rows.
+
+    Attributes:
+        group_column (str): The column whose values define the groups.
+        value_column (str): The numeric column summarized.
+        k (int): The number of largest values kept per group.
+        quantiles (Tuple[float, ...]): The quantiles reported per group.
+        label_column (str, optional): A column reported next to each of the largest values.
+        rows (int): The number of rows seen.
+        groups (dict): The running statistics by group.
+    """
+
+    def __init__(self, group_column: str, value_column: str, k: int = 3,
+                 quantiles: Sequence[float] = (0.5, 0.9, 0.99), label_column: Optional[str] = None,
+                 compression: int = 100) -> None:
+        if type(k) is not int or k <= 0:
+            raise ValueError("k must be a positive integer")
+
+        self.group_column = group_column
+        self.value_column = value_column
+        self.k = k
+        self.quantiles = tuple(quantiles)
+        self.label_column = label_column
+        self.compression = compression
+        self.columns = (group_column, value_column) + ((label_column,) if label_column is not None else ())
+        self.numeric_columns = (value_column,)
+        self.rows = 0
+        self.groups = {}
+
+    def fresh(self) -> 'GroupStatsAggregator':
+        return GroupStatsAggregator(self.group_column, self.value_column, self.k, self.quantiles,
+                                    self.label_column, self.compression)
+
+    def _group(self, group: str) -> Dict[str, Any]:
+        stats = self.groups.get(group)
+        if stats is None:
+            stats = self.groups[group] = {'count': 0, 'sum': [], 'top': [], 'digest': TDigest(self.compression)}
+        return stats
+
+    def _push_top(self, top: List[Tuple[float, int, Optional[str]]], entry: Tuple[float, int, Optional[str]]) -> None:
+        # A min-heap of (value, -row, label): the root is the value to evict
+        if len(top) < self.k:
+            heappush(top, entry)
+        elif entry[:2] > top[0][:2]:
+            heapreplace(top, entry)
+
+    def add(self, values: Tuple[str, ...]) -> None:
+        group, value = values[0], float(values[1])
+        label = values[2] if self.label_column is not None else None
+
+        stats = self._group(group)
+        stats['count'] += 1
+        _add_exact(stats['sum'], value)
+        stats['digest'].add(value)
+        self._push_top(stats['top'], (value, -self.rows, label))
+        self.rows += 1
+
+    def result(self) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for group, stats in self.groups.items():
+            digest = stats['digest']
+            top = sorted(stats['top'], key=lambda entry: entry[:2], reverse=True)
+            report[group] = {
+                'count': stats['count'],
+                'mean': math.fsum(stats['sum']) / stats['count'],
+                'min': digest.min,
+                'max': digest.max,
+                'top': [(value, label) if self.label_column is not None else value for value, _, label in top],
+                'quantiles': {q: digest.quantile(q) for q in self.quantiles}
+            }
+        return report
+
+    def merge(self, other: 'GroupStatsAggregator') -> None:
+        for group, other_stats in other.groups.items():
+            stats = self._group(group)
+            stats['count'] += other_stats['count']
+            for partial in other_stats['sum']:
+                _add_exact(stats['sum'], partial)
+            stats['digest'].merge(other_stats['digest'])
+            # The other rows come after the rows seen here
+            for value, row, label in other_stats['top']:
+                self._push_top(stats['top'], (value, row - self.rows, label))
+        self.rows += other.rows
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            'rows': self.rows,
+            'groups': {group: {'count': stats['count'], 'sum': list(stats['sum']),
+                               'top': [list(entry) for entry in stats['top']],
+                               'digest': stats['digest'].to_state()}
+                       for group, stats in self.groups.items()}
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.rows = state['rows']
+        self.groups = {}
+        for group, saved in state['groups'].items():
+            digest = TDigest(self.compression)
+            digest.load_state(saved['digest'])
+            self.groups[group] = {'count': saved['count'], 'sum': list(saved['sum']),
+                                  'top': [tuple(entry) for entry in saved['top']], 'digest': digest}
+
+
+class AnalysisEngine:
+    """
+    Runs several aggregators over a CSV file in a single pass: every row is
+    parsed once and handed to all registered aggregators. Every run starts
+    from empty aggregators, so an engine can be run again, while feed adds
+    to the rows fed so far.
+
+    Attributes:
+        aggregators (Dict[str, Aggregator]): The registered aggregators by name.
+    """
+
+    def __init__(self) -> None:
+        self.aggregators = {}
+
+    def register(self, name: str, aggregator: Aggregator) -> Aggregator:
+        """
+        Register an aggregator under a name.
+
+        Args:
+            name (str): The name of the report in the results.
+            aggregator (Aggregator): The aggregator to feed.
+
+        Returns:
+            Aggregator: The registered aggregator.
+
+        Raises:
+            ValueError: If the name is already registered.
+        """
+        if name in self.aggregators:
+            raise ValueError(f"An aggregator named {name} is already registered")
+        self.aggregators[name] = aggregator
+        return aggregator
+
+    def reset(self) -> None:
+        """
+        Forget the rows fed to the registered aggregators so far.
+        """
+        for aggregator in self.aggregators.values():
+            aggregator.reset()
+
+    def feed(self, rows: Iterable[Mapping[str, str]]) -> None:
+        """
+        Hand rows keyed by column name, such as csv.DictReader rows, to all registered aggregators.
+
+        Args:
+            rows (Iterable[Mapping[str, str]]): The rows, keyed by column name.
+        """
+        self._feed_projected(rows, {name: aggregator.columns for name, aggregator in self.aggregators.items()})
+
+    def _feed_projected(self, rows: Iterable[Any], keys: Dict[str, Sequence[Any]]) -> None:
+        projections = [(aggregator.add, projector(keys[name])) for name, aggregator in self.aggregators.items()]
+        for row in rows:
+            for add, project in projections:
+                add(project(row))
+
+    def run(self, filepath: str, workers: int = 1, encoding: str = 'utf-8') -> Dict[str, Any]:
+        """
+        Feed a CSV file to all registered aggregators and collect their reports.
+
+        The header is read once and every aggregator gets its columns from the
+        parsed row by position, so no per-row dict is built.
+
+        With several workers the rows are split into one byte range per
+        worker, each starting at a record boundary even when quoted fields
+        hold newlines. Every range is aggregated by a copy of the aggregators
+        in a worker process and the partial aggregates are merged in file
+        order, so the reports equal those of a single process.
+
+        Args:
+            filepath (str): The path to the CSV file.
+            workers (int): The number of worker processes. 1 reads the file in the current process.
+            encoding (str): The encoding of the CSV file.
+
+        Returns:
+            Dict[str, Any]: The report of every aggregator by name.
+
+        Raises:
+            ValueError: If the file lacks a column an aggregator reads or workers is not a positive integer.
+        """
+        if type(workers) is not int or workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        self.reset()
+        if workers > 1:
+            return self._run_parallel(filepath, workers, encoding)
+
+        with open(filepath, 'r', encoding=encoding) as file_handle:
+            reader = csv.reader(file_handle)
+            header = next(reader, [])
+            self.check_columns(header)
+
+            indices = {name: column_indices(header, aggregator.columns)
+                       for name, aggregator in self.aggregators.items()}
+            self._feed_projected(complete_rows(reader, row_width(indices.values())), indices)
+
+        return self.results()
+
+    def _run_parallel(self, filepath: str, workers: int, encoding: str) -> Dict[str, Any]:
+        with open(filepath, 'rb') as file_handle:
+            header_end = _record_start(file_handle, 0, False)
+            file_handle.seek(0)
+            header = next(csv.reader(io.StringIO(file_handle.read(header_end).decode(encoding), newline=None)), [])
+        self.check_columns(header)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ranges = _record_aligned_ranges(filepath, workers, executor)
+            # Workers start from fresh copies, merged into this engine's empty aggregators in file order
+            fresh = {name: aggregator.fresh() for name, aggregator in self.aggregators.items()}
+            futures = [executor.submit(_aggregate_range, filepath, fresh, header, start, end, encoding)
+                       for start, end in ranges]
+            for future in futures:
+                for name, partial in future.result().items():
+                    self.aggregators[name].merge(partial)
+
+        return self.results()
+
+    def run_validated(self, filepath: str, rejects: RejectReport, schema: Optional[Schema] = None,
+                      encoding: str = 'utf-8') -> Dict[str, Any]:
+        """
+        Feed a CSV file to all registered aggregators with its values converted
+        by a schema, skipping malformed rows instead of failing on them.
+
+        Args:
+            filepath (str): The path to the CSV file.
+            rejects (RejectReport): Collects the malformed rows.
+            schema (Schema, optional): The column types. Defaults to float for
+                the numeric columns of the aggregators and str for the others.
+            encoding (str): The encoding of the CSV file.
+
+        Returns:
+            Dict[str, Any]: The report of every aggregator by name, over the valid rows.
+
+        Raises:
+            ValueError: If the file lacks a column an aggregator reads.
+        """
+        # A column is only converted to float if every aggregator reads it through float()
+        types = {}
+        for aggregator in self.aggregators.values():
+            for column in aggregator.columns:
+                numeric = column in aggregator.numeric_columns and types.get(column, float) is float
+                types[column] = float if numeric else str
+        if schema is not None:
+            types.update((column, schema.types[column]) for column in types if column in schema.types)
+        schema = Schema(types)
+        self.reset()
+
+        with open(filepath, 'r', encoding=encoding) as file_handle:
+            header = next(csv.reader(file_handle), [])
+            self.check_columns(header)
+            file_handle.seek(0)
+
+            positions = {column: index for index, column in enumerate(types)}
+            self._feed_projected(schema.read(file_handle, rejects),
+                                 {name: [positions[column] for column in aggregator.columns]
+                                  for name, aggregator in self.aggregators.items()})
+
+        return self.results()
+
+    def run_incremental(self, filepath: str, checkpoint_file: Optional[str] = None,
+                        encoding: str = 'utf-8') -> Dict[str, Any]:
+        """
+        Feed only the rows appended to a CSV file since the previous run and collect the reports.
+
+        The partial state of every aggregator is kept in a checkpoint file
+        together with the byte offset after the last complete row, the inode
+        and the header of the file. A run with a matching checkpoint loads the
+        states and parses the file from that offset on. When the file was
+        replaced, truncated or got a different header, it is read from the
+        start. A last row that is not yet terminated by a newline is included
+        in the reports but not in the checkpoint, so the next run reads it again.
+
+        Args:
+            filepath (str): The path to the CSV file.
+            checkpoint_file (str, optional): Where the checkpoint is stored.
+                Defaults to .{file name}.checkpoint next to the CSV file.
+            encoding (str): The encoding of the CSV file.
+
+        Returns:
+            Dict[str, Any]: The report of every aggregator by name, over the whole file.
+
+        Raises:
+            ValueError: If the file lacks a column an aggregator reads.
+        """
+        if checkpoint_file is None:
+            checkpoint_file = os.path.join(os.path.dirname(filepath), f".{os.path.basename(filepath)}.checkpoint")
+
+        self.reset()
+        # A missing, truncated or corrupt checkpoint means reading the whole file
+        try:
+            with open(checkpoint_file, 'r') as checkpoint_handle:
+                checkpoint = json.load(checkpoint_handle)
+        except (OSError, ValueError):
+            checkpoint = {}
+        if not isinstance(checkpoint, dict):
+            checkpoint = {}
+
+        with open(filepath, 'rb') as file_handle:
+            stat = os.fstat(file_handle.fileno())
+            lines = _LineTracker(file_handle, encoding)
+            reader = csv.reader(lines)
+            header = next(reader, [])
+            if lines.exhausted:
+                # The header line itself is not terminated yet
+                lines.seek(0)
+                header = next(csv.reader(io.StringIO(file_handle.read().decode(encoding), newline=None)), [])
+            self.check_columns(header)
+
+            offset = checkpoint.get('offset', 0)
+            states = checkpoint.get('states', {})
+            resume = checkpoint.get('inode') == stat.st_ino and checkpoint.get('header') == header \
+                and lines.offset <= offset <= stat.st_size and states.keys() == self.aggregators.keys()
+            if resume:
+                # States in a format the aggregators do not read are treated like a corrupt checkpoint
+                try:
+                    for name, aggregator in self.aggregators.items():
+                        aggregator.load_state(states[name])
+                except (KeyError, TypeError, ValueError):
+                    self.reset()
+                    resume = False
+
+            if resume:
+                lines.seek(offset)
+            else:
+                offset = lines.offset
+
+            indices = {name: column_indices(header, aggregator.columns)
+                       for name, aggregator in self.aggregators.items()}
+            width = row_width(indices.values())
+            projections = [(aggregator.add, projector(indices[name])) for name, aggregator in self.aggregators.items()]
+            for row in reader:
+                # A row completed only by the end of the file is still being written
+                if lines.exhausted:
+                    break
+                if row:
+                    if len(row) < width:
+                        row += [None] * (width - len(row))
+                    for add, project in projections:
+                        add(project(row))
+                offset = lines.offset
+
+            temporary_file = checkpoint_file + '.tmp'
+            with open(temporary_file, 'w') as checkpoint_handle:
+                json.dump({'inode': stat.st_ino, 'header': header, 'offset': offset,
+                           'states': {name: aggregator.to_state() for name, aggregator in self.aggregators.items()}},
+                          checkpoint_handle)
+            os.replace(temporary_file, checkpoint_file)
+
+            # Without a complete header line there are no rows yet
+            file_handle.seek(offset)
+            tail = file_handle.read().decode(encoding) if offset else ''
+            if tail:
+                self._feed_projected(complete_rows(csv.reader(io.StringIO(tail, newline=None)), width), indices)
+
+        return self.results()
+
+    def check_columns(self, header: Sequence[str]) -> None:
+        """
+        Check that a CSV header has every column the aggregators read.
+
+        Args:
+            header (Sequence[str]): The column names of the CSV file.
+
+        Raises:
+            ValueError: If a column is missing.
+        """
+        for name, aggregator in self.aggregators.items():
+            missing = [column for column in aggregator.columns if column not in header]
+            if missing:
+                raise ValueError(f"The {name} report needs the missing columns: {', '.join(missing)}")
+
+    def results(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: The current report of every aggregator by name.
+        """
+        return {name: aggregator.result() for name, aggregator in self.aggregators.items()}
+
+
+def _aggregate_range(filepath: str, aggregators: Dict[str, Aggregator], header: List[str],
+                     start: int, end: int, encoding: str) -> Dict[str, Aggregator]:
+    """
+    Feed the rows in the record-aligned byte range [start, end) of a CSV file to aggregators.
+    """
+    engine = AnalysisEngine()
+    for name, aggregator in aggregators.items():
+        engine.register(name, aggregator)
+
+    indices = {name: column_indices(header, aggregator.columns) for name, aggregator in aggregators.items()}
+    rows = csv.reader(_range_lines(filepath, start, end, encoding))
+    engine._feed_projected(complete_rows(rows, row_width(indices.values())), indices)
+    return engine.aggregators
+
+
+def _analyze(filepath: str, aggregator: Aggregator, workers: int = 1, rejects: Optional[RejectReport] = None) -> Any:
+    engine = AnalysisEngine()
+    engine.register('report', aggregator)
+    if rejects is None:
+        return engine.run(filepath, workers)['report']
+    if workers != 1:
+        raise ValueError("Malformed rows can only be collected with workers=1")
+    return engine.run_validated(filepath, rejects)['report']
+
+
+def _analyze_incremental(filepath: str, aggregator: Aggregator, checkpoint_file: Optional[str]) -> Any:
+    engine = AnalysisEngine()
+    engine.register('report', aggregator)
+    return engine.run_incremental(filepath, checkpoint_file)['report']
+
+
+def _aggregate_file(filepath: str, aggregator_class: Type[Aggregator], aggregator_args: Dict[str, Any]) -> Aggregator:
+    aggregator = aggregator_class(**aggregator_args)
+    _analyze(filepath, aggregator)
+    return aggregator
+
+
+def analyze_partitions(filepaths: Sequence[str], aggregator_class: Type[Aggregator],
+                       workers: Optional[int] = None, **aggregator_args: Any) -> Any:
+    """
+    Compute one report over several CSV files, e.g. the partitions of a data set, in parallel.
+
+    Every file is aggregated in a worker process and the partial aggregates
+    are merged in the order of filepaths.
+
+    Args:
+        filepaths (Sequence[str]): The paths to the CSV files.
+        aggregator_class (Type[Aggregator]): The report to compute, e.g. SalesAggregator.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        **aggregator_args: The keyword arguments every aggregator is built with,
+            e.g. group_column and value_column for GroupStatsAggregator.
+
+    Returns:
+        Any: The report over the rows of all files.
+    """
+    merged = aggregator_class(**aggregator_args)
+    with ProcessPoolExecutor(workers) as executor:
+        for partial in executor.map(_aggregate_file, filepaths, repeat(aggregator_class), repeat(aggregator_args)):
+            merged.merge(partial)
+    return merged.result()
+
+
+def analyze_employee_data(filepath: str, workers: int = 1, rejects: Optional[RejectReport] = None
+                          ) -> Tuple[int, dict, str, List[Tuple[float, str]]]:
     """
     Analyze employee data from a CSV file.
 
     Args:
         filepath (str): The path to the CSV file containing employee data.
+        workers (int): The number of worker processes, see AnalysisEngine.run.
+        rejects (RejectReport, optional): Collects malformed rows, which are then
+            skipped instead of raising ValueError. Needs workers=1.
 
     Returns:
         Tuple[int, dict, str, List[Tuple[float, str]]]: A tuple containing:
             - The total number of employees (int).
             - A dictionary with counts of employees by gender (dict).
             - The most common job level (str).
-            - A list of tuples containing the highest problem-solving scores 
+            - A list of tuples containing the highest problem-solving scores
               and their respective genders (List[Tuple[float, str]]).
     """
-    employees_num = 0
-    employees_by_gender = {'Male': 0, 'Female': 0}
-    joblevel_count = {}
-    highest_male = []
-    highest_female = []
-    
-    with open(filepath, 'r') as file_handle:
-        data = csv.DictReader(file_handle)
-        
-        for line in data:
-            employees_num += 1
-            
-            gender = line['Gender']
-            job_level = line['JobLevel']
-            
-            if gender in employees_by_gender:
-                employees_by_gender[gender] += 1
-            
-            if job_level in joblevel_count:
-                joblevel_count[job_level] += 1
-            else:
-                joblevel_count[job_level] = 1
-                
-            problem_solving_score = float(line['ProblemSolvingScore'])
-            
-            if gender == 'Male':
-                highest_male.append(problem_solving_score)
-            else:
-                highest_female.append(problem_solving_score)
-        
-        performance_by_employee = [
-            (max(highest_male), 'Male'),
-            (max(highest_female), 'Female')
-        ]
-        
-        highest_ps_list = sorted(performance_by_employee)
-        common_joblevel = max(joblevel_count, key=joblevel_count.get)
-    
-    return employees_num, employees_by_gender, common_joblevel, highest_ps_list
+    return _analyze(filepath, EmployeeAggregator(), workers, rejects)
+
+
+def analyze_employee_scores(filepath: str, group_column: str = 'Gender', k: int = 3,
+                            quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+                            workers: int = 1) -> Dict[str, Dict[str, Any]]:
+    """
+    Summarize the problem-solving scores of every group of employees.
+
+    Args:
+        filepath (str): The path to the CSV file containing employee data.
+        group_column (str): The column to group by, e.g. 'Gender', 'Department' or 'JobLevel'.
+        k (int): The number of highest scores reported per group.
+        quantiles (Sequence[float]): The quantiles reported per group, e.g. 0.5 for the median.
+        workers (int): The number of worker processes, see AnalysisEngine.run.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For every group, its 'count', 'mean', 'min' and 'max'
+        score, its 'top' k scores (highest first) and its estimated 'quantiles' by quantile.
+    """
+    return _analyze(filepath, GroupStatsAggregator(group_column, 'ProblemSolvingScore', k, quantiles), workers)
 
 
-def analyze_sales_data(filepath: str) -> Tuple[Dict[str, int], Dict[str, float], float, List[str]]:
+def analyze_sales_data(filepath: str, workers: int = 1, rejects: Optional[RejectReport] = None
+                       ) -> Tuple[Dict[str, int], Dict[str, float], float, List[str]]:
     """
     Analyze sales data from a CSV file.
 
     Args:
         filepath (str): The path to the CSV file containing sales data.
+        workers (int): The number of worker processes, see AnalysisEngine.run.
+        rejects (RejectReport, optional): Collects malformed rows, which are then
+            skipped instead of raising ValueError. Needs workers=1.
 
     Returns:
         Tuple[Dict[str, int], Dict[str, float], float, List[str]]: A tuple containing:
@@ -71,50 +1452,57 @@ def analyze_sales_data(filepath: str) -> Tuple[Dict[str, int], Dict[str, float],
             - The highest sale amount (float).
             - A list of product IDs with the highest sale amount (List[str]).
     """
-    sales_by_productcategory = {}
-    salesregion_amounts = {}
-    salesregion_counts = {}
-    id_collect = []
-    saleamount_collect = []
+    return _analyze(filepath, SalesAggregator(), workers, rejects)
 
-    with open(filepath, 'r') as file_handle:
-        data = csv.DictReader(file_handle)
 
-        for line in data:
+def analyze_sales_data_incremental(filepath: str, checkpoint_file: Optional[str] = None
+                                   ) -> Tuple[Dict[str, int], Dict[str, float], float, List[str]]:
+    """
+    Analyze sales data from a CSV file that grows by appends, parsing only the new rows.
 
-            product_category = line['ProductCategory']
-            if product_category in sales_by_productcategory:
-                sales_by_productcategory[product_category] += 1
-            else:
-                sales_by_productcategory[product_category] = 1
+    Args:
+        filepath (str): The path to the CSV file containing sales data.
+        checkpoint_file (str, optional): Where the partial aggregate is stored,
+            see AnalysisEngine.run_incremental.
+
+    Returns:
+        Tuple[Dict[str, int], Dict[str, float], float, List[str]]: The same
+        report as analyze_sales_data.
+    """
+    return _analyze_incremental(filepath, SalesAggregator(), checkpoint_file)
 
-            sales_region = line['SalesRegion']
-            sale_amount = float(line['SaleAmount'])
-            if sales_region in salesregion_amounts:
-                salesregion_amounts[sales_region] += sale_amount
-                salesregion_counts[sales_region] += 1
-            else:
-                salesregion_amounts[sales_region] = sale_amount
-                salesregion_counts[sales_region] = 1
 
-            product_id = line['ProductID']
-            id_collect.append(product_id)
-            saleamount_collect.append(sale_amount)
+def analyze_sales_rows(rows: Iterable[Mapping[str, str]]) -> Tuple[Dict[str, int], Dict[str, float], float, List[str]]:
+    """
+    Analyze sales data from any iterable of rows, e.g. a generator over a network stream.
 
-    max_saleamount = max(saleamount_collect)
-    highest_productid = [id_collect[i] for i in range(len(saleamount_collect)) if saleamount_collect[i] == max_saleamount]
+    The rows are consumed one at a time and only the running aggregates are
+    kept, so memory grows with the number of categories, regions and tied
+    product IDs, not with the number of rows.
 
-    salesregion_avg = {region: round(salesregion_amounts[region] / salesregion_counts[region], 2) for region in salesregion_amounts}
+    Args:
+        rows (Iterable[Mapping[str, str]]): The sales rows keyed by column name,
+            like the rows of csv.DictReader.
 
-    return sales_by_productcategory, salesregion_avg, max_saleamount, highest_productid
+    Returns:
+        Tuple[Dict[str, int], Dict[str, float], float, List[str]]: The same
+        report as analyze_sales_data.
+    """
+    engine = AnalysisEngine()
+    engine.register('report', SalesAggregator())
+    engine.feed(rows)
+    return engine.results()['report']
 
 
-def analyze_bank_data(filepath: str) -> Dict[str, Any]:
+def analyze_bank_data(filepath: str, workers: int = 1, rejects: Optional[RejectReport] = None) -> Dict[str, Any]:
     """
     Analyze bank transaction data from a CSV file.
 
     Args:
         filepath (str): The path to the CSV file containing bank transaction data.
+        workers (int): The number of worker processes, see AnalysisEngine.run.
+        rejects (RejectReport, optional): Collects malformed rows, which are then
+            skipped instead of raising ValueError. Needs workers=1.
 
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -123,31 +1511,19 @@ def analyze_bank_data(filepath: str) -> Dict[str, Any]:
             - 'only_withdrawal': A sorted list of transaction descriptions exclusive to withdrawals (List[str]).
             - 'exclusive_count': The total count of exclusive transaction descriptions (int).
     """
-    deposit_list = set()
-    withdrawal_list = set()
-    
-    with open(filepath, 'r') as file_handle:
-        data = csv.DictReader(file_handle)
-                                
-        for line in data:
-            transaction_type = line['TransactionType']
-            transaction_description = line['TransactionDescription']
-
-            if transaction_type == "Deposit":
-                deposit_list.add(transaction_description)
-            elif transaction_type == "Withdrawal":
-                withdrawal_list.add(transaction_description)
-
-        common = deposit_list.intersection(withdrawal_list)
-
-        only_deposit = sorted(list(deposit_list - common))
-        only_withdrawal = sorted(list(withdrawal_list - common))
-        common = sorted(list(common))
-        exclusive_count = len(only_deposit) + len(only_withdrawal)
+    return _analyze(filepath, BankAggregator(), workers, rejects)
 
-        return {
-            'only_deposit': only_deposit,
-            'common': common,
-            'only_withdrawal': only_withdrawal,
-            'exclusive_count': exclusive_count
-        }
+
+def analyze_bank_data_incremental(filepath: str, checkpoint_file: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Analyze bank transaction data from a CSV file that grows by appends, parsing only the new rows.
+
+    Args:
+        filepath (str): The path to the CSV file containing bank transaction data.
+        checkpoint_file (str, optional): Where the partial aggregate is stored,
+            see AnalysisEngine.run_incremental.
+
+    Returns:
+        Dict[str, Any]: The same report as analyze_bank_data.
+    """
+    return _analyze_incremental(filepath, BankAggregator(), checkpoint_file)
@@ -1,6 +1,16 @@
+import csv
+import json
 import os
+import shutil
+import tempfile
 
-from lab5 import analyze_bank_data, analyze_employee_data, analyze_sales_data
+from columnar_cache import analyze_employee_data_cached, open_cache
+from lab5 import analyze_bank_data, analyze_employee_data, analyze_sales_data, analyze_sales_rows
+from lab5 import analyze_employee_scores
+from lab5 import analyze_bank_data_incremental, analyze_partitions, analyze_sales_data_incremental
+from lab5 import RejectReport, Schema
+from lab5 import Aggregator, AnalysisEngine, BankAggregator, EmployeeAggregator, GroupStatsAggregator, SalesAggregator
+from lab5 import read_projected
 
 
 class Paths:
@@ -43,6 +53,290 @@ def test_bank_data(file_name, expected_output):
     assert sorted_result == sorted_expected
 
 
+def test_analysis_engine(file_name, expected_output):
+    file_path = os.path.join(Paths.EMPLOYEE_DATA_PATH, file_name)
+    engine = AnalysisEngine()
+    engine.register("employees", EmployeeAggregator())
+    engine.register("employees_again", EmployeeAggregator())
+    result = engine.run(file_path)
+    assert result["employees"] == expected_output
+    assert result["employees_again"] == expected_output
+    assert engine.run(file_path) == result, "A second run counted the rows twice"
+
+    class IncompleteAggregator(Aggregator):
+        def add(self, values):
+            pass
+
+    try:
+        IncompleteAggregator()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("An aggregator without result() could be constructed")
+
+    engine.register("transactions", BankAggregator())
+    try:
+        engine.run(file_path)
+    except ValueError as e:
+        assert "TransactionType" in str(e)
+    else:
+        raise AssertionError("Missing columns were not reported")
+
+
+def test_sales_rows(file_name, expected_output):
+    file_path = os.path.join(Paths.SALES_DATA_PATH, file_name)
+    with open(file_path, "r") as file_handle:
+        result = analyze_sales_rows(row for row in csv.DictReader(file_handle))
+    assert result == analyze_sales_data(file_path)
+    assert sorted(result[3]) == sorted(expected_output)
+
+
+def test_incremental(file_path, analyze, analyze_incremental, split_line):
+    with open(file_path, "r") as file_handle:
+        lines = file_handle.readlines()
+
+    with tempfile.TemporaryDirectory() as directory:
+        copy_path = os.path.join(directory, os.path.basename(file_path))
+        checkpoint_path = os.path.join(directory, "checkpoint.json")
+
+        with open(copy_path, "w") as file_handle:
+            file_handle.writelines(lines[:split_line])
+        assert analyze_incremental(copy_path, checkpoint_path) == analyze(copy_path)
+
+        with open(copy_path, "a") as file_handle:
+            file_handle.writelines(lines[split_line:])
+        assert analyze_incremental(copy_path, checkpoint_path) == analyze(file_path)
+        assert analyze_incremental(copy_path, checkpoint_path) == analyze(file_path)
+
+
+def test_crlf_rows(file_name):
+    file_path = os.path.join(Paths.BANK_DATA_PATH, file_name)
+    with open(file_path, "r") as file_handle:
+        lines = file_handle.read().splitlines()
+
+    with tempfile.TemporaryDirectory() as directory:
+        copy_path = os.path.join(directory, file_name)
+        checkpoint_path = os.path.join(directory, "checkpoint.json")
+        # CRLF line endings, also inside quoted fields
+        with open(copy_path, "wb") as file_handle:
+            file_handle.write("\r\n".join(lines + ['Deposit,5.00,"refund\r\nlate"', ""]).encode())
+
+        expected_output = analyze_bank_data(copy_path)
+        assert analyze_bank_data_incremental(copy_path, checkpoint_path) == expected_output
+        assert analyze_bank_data_incremental(copy_path, checkpoint_path) == expected_output
+
+        # A truncated checkpoint is ignored and the whole file is read again
+        with open(checkpoint_path, "r+") as file_handle:
+            file_handle.truncate(10)
+        assert analyze_bank_data_incremental(copy_path, checkpoint_path) == expected_output
+
+
+def test_sales_state(file_name):
+    aggregator = SalesAggregator()
+    with open(os.path.join(Paths.SALES_DATA_PATH, file_name), "r") as file_handle:
+        for row in csv.DictReader(file_handle):
+            aggregator.add((row["ProductID"], row["ProductCategory"], row["SalesRegion"], row["SaleAmount"]))
+
+    restored = SalesAggregator()
+    restored.load_state(json.loads(json.dumps(aggregator.to_state())))
+    assert restored.result() == aggregator.result()
+
+    # Regional totals do not depend on how the rows were split between merged
+    # aggregators: with plain float sums this averages 46.97 in one pass but
+    # 46.98 when summed in two halves
+    amounts = ["89.17", "69.74", "16.63", "42.59", "11.47", "36.19", "11.80", "49.33", "57.40", "71.45",
+               "29.55", "10.01", "82.52", "76.54", "6.46", "97.73", "16.54", "64.11", "32.67", "67.60"]
+    for split in range(len(amounts) + 1):
+        first, second = SalesAggregator(), SalesAggregator()
+        for index, amount in enumerate(amounts):
+            (first if index < split else second).add((f"P{index}", "Home", "North", amount))
+        first.merge(second)
+        assert first.result()[1] == {"North": 46.98}, f"Merged totals differ for split {split}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "single_region.csv")
+        with open(file_path, "w") as file_handle:
+            file_handle.write("ProductID,ProductCategory,SalesRegion,SaleAmount\n")
+            file_handle.writelines(f"P{index},Home,North,{amount}\n" for index, amount in enumerate(amounts))
+        assert analyze_sales_data(file_path, 2) == analyze_sales_data(file_path)
+
+
+def test_partitions(file_name, partition_count, expected_output):
+    file_path = os.path.join(Paths.SALES_DATA_PATH, file_name)
+    with open(file_path, "r") as file_handle:
+        header, *lines = file_handle.readlines()
+
+    with tempfile.TemporaryDirectory() as directory:
+        partition_paths = []
+        for index in range(partition_count):
+            partition_path = os.path.join(directory, f"part_{index}.csv")
+            with open(partition_path, "w") as file_handle:
+                file_handle.writelines([header] + lines[index::partition_count])
+            partition_paths.append(partition_path)
+
+        result = analyze_partitions(partition_paths, SalesAggregator, workers=2)
+
+    sorted_result = (result[0], result[1], result[2], sorted(result[3]))
+    sorted_expected = (expected_output[0], expected_output[1], expected_output[2], sorted(expected_output[3]))
+    assert sorted_result == sorted_expected
+
+
+def test_parallel(file_path, analyze, workers):
+    assert analyze(file_path, workers) == analyze(file_path)
+
+
+def test_columnar_cache(file_name, appended_row):
+    file_path = os.path.join(Paths.EMPLOYEE_DATA_PATH, file_name)
+
+    with tempfile.TemporaryDirectory() as directory:
+        copy_path = os.path.join(directory, file_name)
+        shutil.copyfile(file_path, copy_path)
+
+        assert analyze_employee_data_cached(copy_path) == analyze_employee_data(file_path)
+        assert os.path.exists(os.path.join(directory, f".{file_name}.columns"))
+        assert analyze_employee_data_cached(copy_path) == analyze_employee_data(file_path)
+
+        with open(copy_path, "a") as file_handle:
+            file_handle.write(appended_row + "\n")
+        assert analyze_employee_data_cached(copy_path) == analyze_employee_data(copy_path)
+
+        with open_cache(copy_path) as cache:
+            with open(copy_path, "r") as file_handle:
+                rows = [row for row in csv.reader(file_handle) if row][1:]
+            for index, column in enumerate(cache.header):
+                assert list(cache.values(column)) == [row[index] for row in rows]
+
+        # A truncated cache is rebuilt instead of failing
+        cache_path = os.path.join(directory, f".{file_name}.columns")
+        for length in (4, 12, 40, os.path.getsize(cache_path) - 8):
+            with open(cache_path, "r+b") as file_handle:
+                file_handle.truncate(length)
+            assert analyze_employee_data_cached(copy_path) == analyze_employee_data(copy_path)
+
+        # Fields missing from a short row are None on both paths
+        with open(copy_path, "a") as file_handle:
+            file_handle.write("Female,Department A,Entry Level\n")
+        with open_cache(copy_path) as cache:
+            assert list(cache.values("ProblemSolvingScore"))[-1] is None
+            assert list(cache.values("Department"))[-1] == "Department A"
+        for analyze in (analyze_employee_data, analyze_employee_data_cached):
+            try:
+                analyze(copy_path)
+            except TypeError:
+                pass
+            else:
+                raise AssertionError(f"{analyze.__name__} read a missing score as a number")
+
+
+def test_employee_scores(file_name, group_column, k, quantiles, expected_output):
+    file_path = os.path.join(Paths.EMPLOYEE_DATA_PATH, file_name)
+    result = analyze_employee_scores(file_path, group_column, k, quantiles)
+    assert result == expected_output
+    assert analyze_employee_scores(file_path, group_column, k, quantiles, workers=2) == expected_output
+
+    with open(file_path, "r") as file_handle:
+        header, *lines = file_handle.readlines()
+    with tempfile.TemporaryDirectory() as directory:
+        partition_paths = []
+        for index, part in enumerate((lines[:len(lines) // 2], lines[len(lines) // 2:])):
+            partition_path = os.path.join(directory, f"part_{index}.csv")
+            with open(partition_path, "w") as file_handle:
+                file_handle.writelines([header] + part)
+            partition_paths.append(partition_path)
+
+        result = analyze_partitions(partition_paths, GroupStatsAggregator, workers=2, group_column=group_column,
+                                    value_column="ProblemSolvingScore", k=k, quantiles=quantiles)
+    assert result == expected_output
+
+
+def test_rejects(file_name, malformed_rows, expected_lines):
+    file_path = os.path.join(Paths.SALES_DATA_PATH, file_name)
+
+    with tempfile.TemporaryDirectory() as directory:
+        copy_path = os.path.join(directory, file_name)
+        with open(file_path, "r") as file_handle:
+            lines = [line for line in file_handle if line.strip()]
+        with open(copy_path, "w") as file_handle:
+            file_handle.writelines(lines[:3] + malformed_rows + lines[3:])
+
+        rejects = RejectReport()
+        result = analyze_sales_data(copy_path, rejects=rejects)
+
+        try:
+            analyze_sales_data(copy_path)
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+    assert result == analyze_sales_data(file_path)
+    assert [row[0] for row in rejects.rows] == expected_lines
+
+
+def test_schema(file_name, expected_types, expected_first_row):
+    file_path = os.path.join(Paths.EMPLOYEE_DATA_PATH, file_name)
+    with open(file_path, "r") as file_handle:
+        schema = Schema.infer(file_handle)
+    assert schema.types == expected_types
+
+    with open(file_path, "r") as file_handle:
+        assert next(schema.read(file_handle)) == expected_first_row
+
+    # A row failing only as a whole is still reported, without a column
+    calls = []
+
+    def flaky(value):
+        calls.append(value)
+        if len(calls) <= 2:
+            raise ValueError("failed as a whole")
+        return value
+
+    rejects = RejectReport()
+    with open(file_path, "r") as file_handle:
+        rows = list(Schema({"Gender": flaky}).read(file_handle, rejects))
+    assert rejects.rows == [(2, None, None, "failed as a whole")]
+    assert len(rows) == len(calls) - 3
+
+    # Blocks of plain rows and blocks that need csv.reader give the same rows
+    with tempfile.TemporaryDirectory() as directory:
+        mixed_path = os.path.join(directory, "mixed.csv")
+        with open(mixed_path, "w") as file_handle:
+            file_handle.write('a,b\n1,x\n2,y\n"3","z\nw"\n\n4\nfive,v\n6,u,extra\n7,t\n')
+        with open(mixed_path, "r") as file_handle:
+            expected_rows = [(float(row[0]), row[1]) for row in list(csv.reader(file_handle))[1:]
+                             if len(row) >= 2 and row[0] != "five"]
+        for block_size in (1, 4, 1 << 14):
+            rejects = RejectReport()
+            with open(mixed_path, "r") as file_handle:
+                rows = list(Schema({"a": float, "b": str}).read(file_handle, rejects, block_size))
+            assert rows == expected_rows, f"Schema.read failed for block size {block_size}"
+            assert [row[0] for row in rejects.rows] == [7, 8], f"Wrong reject lines for block size {block_size}"
+
+
+def test_short_rows(file_name, short_rows, expected_projected):
+    file_path = os.path.join(Paths.BANK_DATA_PATH, file_name)
+    expected_output = analyze_bank_data(file_path)
+
+    with tempfile.TemporaryDirectory() as directory:
+        copy_path = os.path.join(directory, file_name)
+        shutil.copyfile(file_path, copy_path)
+        with open(copy_path, "a") as file_handle:
+            file_handle.writelines(["\n"] + short_rows)
+
+        assert analyze_bank_data(copy_path) == expected_output
+        assert analyze_bank_data(copy_path, 2) == expected_output
+        assert analyze_bank_data_incremental(copy_path, os.path.join(directory, "checkpoint.json")) == expected_output
+        with open(copy_path, "r") as file_handle:
+            result = list(read_projected(file_handle, ["TransactionType", "TransactionDescription"]))
+        assert result[-len(expected_projected):] == expected_projected
+
+
+def test_read_projected(file_name, columns, expected_output):
+    file_path = os.path.join(Paths.SALES_DATA_PATH, file_name)
+    with open(file_path, "r") as file_handle:
+        result = list(read_projected(file_handle, columns))
+    assert result[:len(expected_output)] == expected_output
+
+
 if __name__ == "__main__":
     test_employee_data(
         "data_1.csv",
@@ -73,3 +367,93 @@ if __name__ == "__main__":
             "exclusive_count": 5,
         },
     )
+
+    test_analysis_engine(
+        "data_1.csv",
+        (
+            4,
+            {"Male": 2, "Female": 2},
+            "Entry Level",
+            [(93, "Female"), (93, "Male")],
+        ),
+    )
+
+    test_read_projected(
+        "data_1.csv",
+        ["SaleAmount", "ProductID"],
+        [("200.50", "P001"), ("150.72", "P002"), ("300.00", "P003")],
+    )
+
+    test_sales_rows("data_1.csv", ["P005", "P008"])
+
+    test_incremental(
+        os.path.join(Paths.SALES_DATA_PATH, "data_1.csv"), analyze_sales_data, analyze_sales_data_incremental, 6
+    )
+
+    test_sales_state("data_1.csv")
+
+    test_incremental(
+        os.path.join(Paths.BANK_DATA_PATH, "data_1.csv"), analyze_bank_data, analyze_bank_data_incremental, 4
+    )
+
+    test_crlf_rows("data_1.csv")
+
+    test_partitions(
+        "data_1.csv",
+        3,
+        (
+            {"Electronics": 4, "Clothing": 3, "Home": 3},
+            {"North": 400.19, "South": 175.61, "East": 260.03, "West": 250.25},
+            500.00,
+            ["P005", "P008"],
+        ),
+    )
+
+    test_parallel(os.path.join(Paths.EMPLOYEE_DATA_PATH, "data_1.csv"), analyze_employee_data, 2)
+
+    test_parallel(os.path.join(Paths.SALES_DATA_PATH, "data_1.csv"), analyze_sales_data, 3)
+
+    test_parallel(os.path.join(Paths.BANK_DATA_PATH, "data_1.csv"), analyze_bank_data, 2)
+
+    test_columnar_cache("data_1.csv", "Male,Department C,Senior Level,20,91,80,97")
+
+    test_employee_scores(
+        "data_1.csv",
+        "JobLevel",
+        1,
+        (0.5, 0.9),
+        {
+            "Entry Level": {"count": 2, "mean": 92.5, "min": 92.0, "max": 93.0, "top": [93.0],
+                            "quantiles": {0.5: 92.5, 0.9: 92.9}},
+            "Mid Level": {"count": 1, "mean": 89.0, "min": 89.0, "max": 89.0, "top": [89.0],
+                          "quantiles": {0.5: 89.0, 0.9: 89.0}},
+            "Senior Level": {"count": 1, "mean": 93.0, "min": 93.0, "max": 93.0, "top": [93.0],
+                             "quantiles": {0.5: 93.0, 0.9: 93.0}},
+        },
+    )
+
+    test_rejects(
+        "data_1.csv",
+        ["P011,Home,North,n/a\n", "P012,Home\n", '"P013",Home,"South\nEast",\n'],
+        [4, 5, 6],
+    )
+
+    test_short_rows(
+        "data_1.csv",
+        ["Transfer,25.00\n", "Fee\n"],
+        [("Transfer", None), ("Fee", None)],
+    )
+
+    test_schema(
+        "data_1.csv",
+        {
+            "Gender": str,
+            "Department": str,
+            "JobLevel": str,
+            "YearsExperience": int,
+            "TechnicalSkillScore": int,
+            "CommunicationSkillScore": int,
+            "ProblemSolvingScore": int,
+        },
+        ("Male", "Department A", "Entry Level", 1, 78, 85, 92),
+    )